@@ -6,7 +6,9 @@ ARCHITECTURE
 LLM -> stdio -> sd_mcp_bridge.py (FastMCP) -> TCP -> this plugin -> sd.api
 PORT: 9881 (all clients: Claude Code, Claude Desktop, Cursor)
 PROTOCOL: Length-prefix framing [4-byte big-endian length][JSON payload]
-CONNECTION MODEL: Fresh TCP socket per command (no persistent connections)
+CONNECTION MODEL: Persistent TCP socket per client (N framed commands per connection,
+                  TCP_NODELAY + SO_KEEPALIVE; closed by the client or after CLIENT_TIMEOUT idle;
+                  at most MAX_CLIENTS at once, extra clients get an error frame)
 THREADING: ALL sd.api calls on Qt main thread via Signal/Slot queued dispatch
 
 ═══════════════════════════════════════════════════════════════════════════════
@@ -60,14 +62,19 @@ import re
 import json
 import struct
 import socket
-import select
+import selectors
 import threading
+import concurrent.futures
 import traceback
 import sys
 import io
 import time
+import types
 import queue
+import functools
+import itertools
 import importlib as _importlib
+from collections.abc import Mapping
 from contextlib import redirect_stdout, redirect_stderr
 
 # ── SD API imports ───────────────────────────────────────────────────────────
@@ -86,6 +93,16 @@ from sd.api.sdvaluefloat4  import SDValueFloat4
 from sd.api.sdvaluecolorrgba import SDValueColorRGBA
 from sd.api.sbs.sdsbscompgraph import SDSBSCompGraph
 
+# ── Recipe library (imported once; recipe tools report if it failed) ────────
+try:
+    from .recipes import RECIPE_REGISTRY, HEIGHTMAP_RECIPES
+    _RECIPES_ERROR = None
+    _HEIGHTMAP_STYLES = tuple(sorted(HEIGHTMAP_RECIPES))
+except ImportError as _e:
+    RECIPE_REGISTRY = HEIGHTMAP_RECIPES = None
+    _HEIGHTMAP_STYLES = ()
+    _RECIPES_ERROR = "Recipes module not loaded: {}".format(_e)
+
 # ── Configuration ────────────────────────────────────────────────────────────
 DEFAULT_PORTS     = [9881]
 PLUGIN_VERSION    = (3, 3, 0)
@@ -93,7 +110,9 @@ HEADER_SIZE       = 4
 COMMAND_TIMEOUT   = 120
 CLIENT_TIMEOUT    = 130
 ACCEPT_BACKLOG    = 5
+MAX_CLIENTS       = 8                   # worker threads; each persistent client holds one
 MAX_MSG_SIZE      = 100 * 1024 * 1024   # 100 MB
+LOG_ENABLED       = True                # False silences the [SD-MCP] console log
 
 # System properties not valid as connection targets
 _SYSTEM_PARAMS = frozenset({
@@ -101,9 +120,16 @@ _SYSTEM_PARAMS = frozenset({
     "$tiling", "$randomseed", "$time"
 })
 
+# Property category per _prop_map kind
+_PROP_CATEGORIES = {
+    "in":    SDPropertyCategory.Input,
+    "out":   SDPropertyCategory.Output,
+    "annot": SDPropertyCategory.Annotation,
+}
+
 # ── Known atomic node port registry ─────────────────────────────────────────
 # Source: Adobe SD docs + empirical testing. Prevents wrong-port crashes.
-ATOMIC_PORTS = {
+ATOMIC_PORTS = types.MappingProxyType({
     "sbs::compositing::blend": {
         "inputs":  ["source", "destination", "opacity"],
         "outputs": ["unique_filter_output"],
@@ -192,10 +218,10 @@ ATOMIC_PORTS = {
         "inputs":  ["input1"],
         "outputs": ["unique_filter_output"],
     },
-}
+})
 
 # ── Blend mode constants ─────────────────────────────────────────────────────
-BLEND_MODES = {
+BLEND_MODES = types.MappingProxyType({
     "copy": 0, "normal": 0,
     "add": 1, "linear_dodge": 1,
     "subtract": 2,
@@ -208,62 +234,126 @@ BLEND_MODES = {
     "hard_light": 12,
     "divide": 13,
     "difference": 14,
-}
+})
 
 # ── Globals ──────────────────────────────────────────────────────────────────
 _server = None
 _library_cache = {}   # filter_text -> list of {identifier, url, package}
 
 # ── Logging ──────────────────────────────────────────────────────────────────
-def _log(msg):
-    print("[SD-MCP] {}".format(msg))
+def _log(msg, *args):
+    """Print to SD's console. Arguments are formatted into msg only when
+    logging is on, so disabled call sites don't build their strings."""
+    if not LOG_ENABLED:
+        return
+    print("[SD-MCP] " + (msg.format(*args) if args else str(msg)))
 
 
 # ── PySide6 path injection ───────────────────────────────────────────────────
-def _inject_sd_pyside_path():
-    candidates = []
+# The discovery walk (psutil + drive scan) is slow on cold disks and reruns on
+# every plugin reload: remember the last hit in an env var and a small file.
+# A remembered path is only trusted when it belongs to the running SD install,
+# so an older or side-by-side install's PySide6 never shadows this one's.
+_PYSIDE_ENV_VAR    = "SD_MCP_PYSIDE_PATH"
+_PYSIDE_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".sd_mcp_pyside.json")
+
+
+def _in_running_install(site_pkg):
+    try:
+        root = os.path.normcase(os.path.dirname(os.path.realpath(sys.executable)))
+        path = os.path.normcase(os.path.realpath(site_pkg))
+        return bool(sys.executable) and os.path.commonpath([root, path]) == root
+    except Exception:
+        return False   # e.g. different drives on Windows
+
+
+def _cached_pyside_path():
+    paths = [os.environ.get(_PYSIDE_ENV_VAR)]
+    try:
+        with open(_PYSIDE_CACHE_FILE, "r", encoding="utf-8") as f:
+            paths.append(json.load(f).get("site_packages"))
+    except Exception:
+        pass
+    for site_pkg in paths:
+        if (site_pkg and _in_running_install(site_pkg)
+                and os.path.isdir(os.path.join(site_pkg, 'PySide6'))):
+            return site_pkg
+    return None
+
+
+def _remember_pyside_path(site_pkg):
+    os.environ[_PYSIDE_ENV_VAR] = site_pkg
+    try:
+        with open(_PYSIDE_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"site_packages": site_pkg}, f)
+    except Exception:
+        pass
+
+
+# Candidate SD install roots, cheapest/most likely first. Generators so the
+# drive enumeration only runs when the earlier sources found nothing usable.
+def _cand_from_psutil():
     try:
         import psutil
-        for proc in psutil.process_iter(['name', 'exe']):
+        procs = list(psutil.process_iter(['name', 'exe']))
+    except Exception:
+        return
+    for proc in procs:
+        try:
             name = (proc.info.get('name') or '').lower()
             if 'substance' in name and 'designer' in name:
                 exe = proc.info.get('exe') or ''
                 if exe:
-                    candidates.append(os.path.dirname(exe))
-    except Exception:
-        pass
+                    yield os.path.dirname(exe)
+        except Exception:
+            continue
+
 
+def _cand_from_sys_exe():
     try:
         exe_dir = os.path.dirname(sys.executable)
         for _ in range(4):
             site_pkg = os.path.join(exe_dir, 'Lib', 'site-packages')
             if os.path.isdir(os.path.join(site_pkg, 'PySide6')):
-                candidates.append(exe_dir)
-                break
+                yield exe_dir
+                return
             exe_dir = os.path.dirname(exe_dir)
     except Exception:
-        pass
+        return
 
-    try:
-        for drive in ('C:', 'D:', 'E:', 'F:'):
-            for base in (
-                drive + '\\Program Files\\Adobe',
-                drive + '\\Program Files (x86)\\Adobe',
-                drive + '\\Create\\Build\\DCC\\SubstanceDesigner',
-            ):
+
+def _cand_from_drives():
+    for drive in ('C:', 'D:', 'E:', 'F:'):
+        for base in (
+            drive + '\\Program Files\\Adobe',
+            drive + '\\Program Files (x86)\\Adobe',
+            drive + '\\Create\\Build\\DCC\\SubstanceDesigner',
+        ):
+            try:
                 if not os.path.isdir(base):
                     continue
-                for item in os.listdir(base):
-                    if 'substance' in item.lower() and 'designer' in item.lower():
-                        candidates.append(os.path.join(base, item))
-    except Exception:
-        pass
+                items = os.listdir(base)
+            except Exception:
+                continue
+            for item in items:
+                if 'substance' in item.lower() and 'designer' in item.lower():
+                    yield os.path.join(base, item)
 
-    for sd_root in candidates:
+
+def _inject_sd_pyside_path():
+    site_pkg = _cached_pyside_path()
+    if site_pkg:
+        if site_pkg not in sys.path:
+            sys.path.insert(0, site_pkg)
+        return site_pkg
+
+    for sd_root in itertools.chain(_cand_from_psutil(), _cand_from_sys_exe(),
+                                   _cand_from_drives()):
         site_pkg = os.path.join(sd_root, 'plugins', 'pythonsdk', 'Lib', 'site-packages')
         if os.path.isdir(os.path.join(site_pkg, 'PySide6')):
             if site_pkg not in sys.path:
                 sys.path.insert(0, site_pkg)
+            _remember_pyside_path(site_pkg)
             return site_pkg
     return None
 
@@ -305,24 +395,40 @@ class _Invoker:
                 def __init__(self):
                     super().__init__()
                     self._queue = queue.Queue()
+                    # True while a wake-up is queued in Qt and not yet started:
+                    # producers then skip the emit, the drainer will pick them up.
+                    self._wake_pending = False
+                    self._wake_lock = threading.Lock()
                     self.invoke_signal.connect(self._execute, qtcore.Qt.QueuedConnection)
 
                 def schedule(self, fn):
                     self._queue.put(fn)
+                    with self._wake_lock:
+                        if self._wake_pending:
+                            return
+                        self._wake_pending = True
                     self.invoke_signal.emit()
 
                 def _execute(self):
-                    try:
-                        fn = self._queue.get_nowait()
-                        fn()
-                    except queue.Empty:
-                        pass
-                    except Exception as e:
-                        _log("Invoker._execute error: {}".format(e))
+                    # Clear the flag BEFORE draining so a put racing with the
+                    # drain either gets drained here or emits a fresh wake-up.
+                    with self._wake_lock:
+                        self._wake_pending = False
+                    # Drain everything queued so far in one slot invocation —
+                    # concurrent clients' jobs share a single Qt round-trip.
+                    while True:
+                        try:
+                            fn = self._queue.get_nowait()
+                        except queue.Empty:
+                            return
+                        try:
+                            fn()
+                        except Exception as e:
+                            _log("Invoker._execute error: {}", e)
 
             return Invoker()
         except Exception as e:
-            _log("Warning: _Invoker build failed: {}".format(e))
+            _log("Warning: _Invoker build failed: {}", e)
             return None
 
 
@@ -341,24 +447,29 @@ class MainThreadDispatcher:
             return None, RuntimeError(
                 "Qt invoker unavailable — cannot dispatch to main thread." + hint)
 
-        result_holder = [None, None]
-        done = threading.Event()
+        fut = concurrent.futures.Future()
 
         def _call():
+            if not fut.set_running_or_notify_cancel():
+                return   # caller already gave up (timed out) — don't run it late
             try:
-                result_holder[0] = fn(*args, **kwargs)
+                fut.set_result(fn(*args, **kwargs))
             except Exception as e:
-                result_holder[1] = e
-            finally:
-                done.set()
+                fut.set_exception(e)
+            except BaseException as e:
+                # SystemExit & co. must not escape into Qt's event loop
+                fut.set_exception(RuntimeError("{}: {}".format(type(e).__name__, e)))
 
         invoker.schedule(_call)
 
-        if not done.wait(timeout=COMMAND_TIMEOUT):
+        try:
+            return fut.result(timeout=COMMAND_TIMEOUT), None
+        except concurrent.futures.TimeoutError:
+            fut.cancel()
             return None, TimeoutError(
                 "Main thread dispatch timed out after {}s".format(COMMAND_TIMEOUT))
-
-        return result_holder[0], result_holder[1]
+        except Exception as e:
+            return None, e
 
 
 _dispatcher = MainThreadDispatcher()
@@ -372,37 +483,63 @@ def _run_on_main(fn, *args, **kwargs):
 
 
 # ── Length-prefix protocol ───────────────────────────────────────────────────
-def _recv_exact(sock, n, timeout=COMMAND_TIMEOUT):
-    sock.settimeout(timeout)
-    buf = b""
-    while len(buf) < n:
+_FRAME_HEADER = struct.Struct(">I")   # compiled once; big-endian payload length
+
+
+def _recv_into(sock, view, n):
+    """Fill view[:n] from the socket. Returns False on clean disconnect."""
+    got = 0
+    while got < n:
         try:
-            chunk = sock.recv(n - len(buf))
+            r = sock.recv_into(view[got:n], n - got)
         except socket.timeout:
-            raise socket.timeout("Timed out reading {} bytes (got {})".format(n, len(buf)))
-        if not chunk:
+            raise socket.timeout("Timed out reading {} bytes (got {})".format(n, got))
+        if not r:
+            return False
+        got += r
+    return True
+
+
+def _recv_exact(sock, n):
+    # One preallocated buffer filled in place — no per-chunk concat copies
+    buf = bytearray(n)
+    with memoryview(buf) as view:
+        if not _recv_into(sock, view, n):
             return None
-        buf += chunk
-    return buf
+    return bytes(buf)
 
 
-def _recv_framed(sock, timeout=COMMAND_TIMEOUT):
-    header = _recv_exact(sock, HEADER_SIZE, timeout)
+def _recv_framed(sock, timeout=COMMAND_TIMEOUT, buf=None):
+    """Read one frame. With buf (a per-connection bytearray) the payload is
+    received into that reused buffer and returned as a memoryview slice —
+    the caller must release() it before the next call. Without buf, bytes.
+    """
+    if sock.gettimeout() != timeout:
+        sock.settimeout(timeout)
+    header = _recv_exact(sock, HEADER_SIZE)
     if not header:
         return None
-    msg_len = struct.unpack(">I", header)[0]
+    msg_len = _FRAME_HEADER.unpack(header)[0]
     if msg_len == 0:
         return None
     if msg_len > MAX_MSG_SIZE:
         raise ValueError("Message too large: {} bytes".format(msg_len))
-    payload = _recv_exact(sock, msg_len, timeout)
-    if not payload:
+    if buf is None:
+        return _recv_exact(sock, msg_len)
+    # Grow only, never shrink: bounded by MAX_MSG_SIZE above
+    if len(buf) < msg_len:
+        buf.extend(bytes(msg_len - len(buf)))
+    view = memoryview(buf)[:msg_len]
+    if not _recv_into(sock, view, msg_len):
+        view.release()
         return None
-    return payload
+    return view
 
 
 def _send_framed(sock, data):
-    sock.sendall(struct.pack(">I", len(data)) + data)
+    # Header + payload in one sendall (sendmsg would skip the copy, but SD's
+    # Windows Python doesn't have it)
+    sock.sendall(_FRAME_HEADER.pack(len(data)) + data)
 
 
 # ── TCP Server ───────────────────────────────────────────────────────────────
@@ -412,11 +549,19 @@ class SDMCPServer:
         self.ports = ports or DEFAULT_PORTS
         self.running = False
         self.listeners = {}
+        self._selector = None                # listener readiness; key.data = port
+        self._pool = None                    # client workers (sd.api still serializes via Qt)
         self._thread = None
         self._handler = CommandHandler()
+        self._clients = set()                # open client sockets (closed on stop)
+        self._clients_lock = threading.Lock()
+        self._active = 0                     # accepted clients holding or awaiting a worker
 
     def start(self):
         self.running = True
+        self._selector = selectors.DefaultSelector()   # epoll / kqueue / select
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=MAX_CLIENTS, thread_name_prefix="SD-MCP-Worker")
         for port in self.ports:
             try:
                 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -424,10 +569,11 @@ class SDMCPServer:
                 sock.bind((self.host, port))
                 sock.listen(ACCEPT_BACKLOG)
                 sock.setblocking(False)
+                self._selector.register(sock, selectors.EVENT_READ, data=port)
                 self.listeners[port] = sock
-                _log("Listening on {}:{}".format(self.host, port))
+                _log("Listening on {}:{}", self.host, port)
             except Exception as e:
-                _log("Failed to bind port {}: {}".format(port, e))
+                _log("Failed to bind port {}: {}", port, e)
 
         if not self.listeners:
             _log("ERROR: No ports could be opened!")
@@ -436,74 +582,144 @@ class SDMCPServer:
         self._thread = threading.Thread(
             target=self._serve_loop, daemon=True, name="SD-MCP-Serve")
         self._thread.start()
-        _log("v{} running on ports: {}".format(
-            ".".join(map(str, PLUGIN_VERSION)), list(self.listeners.keys())))
+        # Own short-lived thread: the pool's workers are reserved for clients
+        threading.Thread(target=_warm_recipes, daemon=True, name="SD-MCP-Warmup").start()
+        _log("v{} running on ports: {}",
+             ".".join(map(str, PLUGIN_VERSION)), list(self.listeners.keys()))
 
     def stop(self):
         self.running = False
+        if self._selector is not None:
+            try:
+                self._selector.close()
+            except Exception:
+                pass
+            self._selector = None
         for sock in self.listeners.values():
             try:
                 sock.close()
             except Exception:
                 pass
         self.listeners.clear()
+        # Persistent clients would otherwise keep talking to this (stale) handler
+        with self._clients_lock:
+            clients = list(self._clients)
+            self._clients.clear()
+        for client in clients:
+            # close() alone doesn't wake a recv blocked in a worker on Linux/macOS;
+            # shutdown() does, so workers exit now instead of at CLIENT_TIMEOUT
+            try:
+                client.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            try:
+                client.close()
+            except Exception:
+                pass
+        if self._pool is not None:
+            # Don't block SD's UI on workers — their sockets are shut down above
+            self._pool.shutdown(wait=False)
+            self._pool = None
         _log("Server stopped")
 
     def _serve_loop(self):
+        selector = self._selector
         while self.running:
-            readable = list(self.listeners.values())
-            if not readable:
-                time.sleep(0.1)
-                continue
             try:
-                ready, _, _ = select.select(readable, [], [], 0.1)
+                events = selector.select(0.1)
             except (OSError, ValueError):
                 if not self.running:
                     break
                 time.sleep(0.1)
                 continue
 
-            for listener in ready:
-                port = next((p for p, s in self.listeners.items() if s is listener), None)
-                if port is None:
-                    continue
+            for key, _ in events:
+                listener = key.fileobj
+                port     = key.data
                 try:
                     client, addr = listener.accept()
                 except (BlockingIOError, OSError):
                     continue
+                # Connections are persistent: serve each one on a pool worker so a
+                # connected client never blocks accepts on the serve loop. A worker
+                # is held for the whole connection, so beyond MAX_CLIENTS a new
+                # client is refused with an error frame rather than left queued.
+                with self._clients_lock:
+                    full = self._active >= MAX_CLIENTS
+                    if not full:
+                        self._active += 1
+                if full:
+                    _log("Refusing client on port {}: {} already connected", port, MAX_CLIENTS)
+                    self._refuse(client)
+                    continue
                 try:
-                    self._handle_client(client, addr, port)
+                    self._pool.submit(self._handle_client, client, addr, port)
                 except Exception as e:
-                    _log("Unexpected error: {}".format(e))
+                    _log("Unexpected error: {}", e)
+                    with self._clients_lock:
+                        self._active -= 1
+                    try:
+                        client.close()
+                    except Exception:
+                        pass
+
+    @staticmethod
+    def _refuse(client):
+        try:
+            client.settimeout(1.0)
+            _send_framed(client, _json_dumps(
+                {"status": "error",
+                 "message": "SD MCP server busy: {} clients already connected".format(MAX_CLIENTS)}))
+        except OSError:
+            pass
+        finally:
+            try:
+                client.close()
+            except Exception:
+                pass
 
     def _handle_client(self, client, addr, port):
+        with self._clients_lock:
+            self._clients.add(client)
         try:
             client.setblocking(True)
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            client.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
             client.settimeout(CLIENT_TIMEOUT)
-            _log("Client on port {}: {}".format(port, addr))
-
-            payload = _recv_framed(client, timeout=CLIENT_TIMEOUT)
-            if payload is None:
-                return
+            _log("Client on port {}: {}", port, addr)
+
+            # Serve framed commands until the client closes (or goes idle too long).
+            # One receive buffer per connection, reused across frames.
+            rbuf = bytearray()
+            while self.running:
+                payload = _recv_framed(client, timeout=CLIENT_TIMEOUT, buf=rbuf)
+                if payload is None:
+                    break
 
-            try:
-                command = json.loads(payload.decode('utf-8'))
-            except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                _send_framed(client, json.dumps(
-                    {"status": "error", "message": "Invalid JSON: {}".format(e)}
-                ).encode("utf-8"))
-                return
+                try:
+                    try:
+                        command = _json_loads(payload)
+                    finally:
+                        payload.release()   # rbuf may need to grow next frame
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                    _send_framed(client, _json_dumps(
+                        {"status": "error", "message": "Invalid JSON: {}".format(e)}))
+                    continue
 
-            response = self._execute_safe(command)
-            _send_framed(client, json.dumps(response, default=_json_safe).encode("utf-8"))
+                response = self._execute_safe(command)
+                _send_framed(client, _json_dumps(response))
 
         except socket.timeout:
-            _log("Timeout from client on port {}".format(port))
-        except ConnectionResetError:
+            _log("Idle timeout from client on port {}", port)
+        except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
             pass
         except Exception as e:
-            _log("Error handling client on port {}: {}".format(port, e))
+            if self.running:
+                _log("Error handling client on port {}: {}", port, e)
         finally:
+            with self._clients_lock:
+                self._clients.discard(client)
+                self._active -= 1
             try:
                 client.close()
             except Exception:
@@ -513,12 +729,12 @@ class SDMCPServer:
         try:
             cmd_type = command.get("type")
             params   = command.get("params", {})
-            _log("Executing: {}".format(cmd_type))
+            _log("Executing: {}", cmd_type)
             result = _run_on_main(self._handler.dispatch, cmd_type, params)
-            _log("Done: {}".format(cmd_type))
+            _log("Done: {}", cmd_type)
             return {"status": "success", "result": result if result is not None else {}}
         except Exception as e:
-            _log("Error in {}: {}".format(command.get("type", "?"), e))
+            _log("Error in {}: {}", command.get("type", "?"), e)
             try:
                 traceback.print_exc()
             except Exception:
@@ -526,40 +742,61 @@ class SDMCPServer:
             return {"status": "error", "message": str(e)}
 
 
+# Call-independent part of the execute_code namespace
+_EXEC_NS_TEMPLATE = {"sd": sd}
+
+
 def _json_safe(obj):
-    if isinstance(obj, float):
-        if obj != obj:
-            return None
-        if obj == float('inf'):
-            return 1e308
-        if obj == float('-inf'):
-            return -1e308
+    """default= hook: anything the encoders can't serialize becomes its str()."""
     return str(obj)
 
 
+# ── JSON codec: orjson when SD's Python has it, stdlib otherwise ─────────────
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_dumps(obj):
+    """Serialize to UTF-8 JSON bytes."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, default=_json_safe, option=_orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass   # JSONEncodeError is a TypeError — e.g. ints beyond 64 bits; stdlib copes
+    return json.dumps(obj, default=_json_safe).encode("utf-8")
+
+
+def _json_loads(data):
+    """Parse UTF-8 JSON from bytes / bytearray / memoryview."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(str(data, 'utf-8'))
+
+
 # ── Helper: infer SD value type from Python ──────────────────────────────────
 # CRITICAL: bare int scalars → "float" because almost all SD node params are float.
 # Only explicit {"value": x, "type": "int"} should produce SDValueInt.
 # Sending SDValueInt to a float param CRASHES SD 15 silently.
+# Exact-type dispatch: type(True) is bool (not int), so no bool-before-int ordering trap.
+_INFER_SCALAR = {
+    bool:  "bool",
+    int:   "float",   # int scalar → float (avoids SDValueInt crash on float params)
+    float: "float",
+    str:   "string",
+}
+# CRITICAL: SD 15 silently crashes on SDValueInt2/3/4 applied to float params.
+# Always use float vectors — int vector params MUST use explicit {"value":..., "type":"int2"}
+_INFER_VECTOR = {2: "float2", 3: "float3", 4: "float4"}
+
+
 def _infer_type(value):
-    if isinstance(value, bool):
-        return "bool"
-    if isinstance(value, int):
-        return "float"   # int scalar → float (avoids SDValueInt crash on float params)
-    if isinstance(value, float):
-        return "float"
-    if isinstance(value, str):
-        return "string"
+    t = _INFER_SCALAR.get(type(value))
+    if t is not None:
+        return t
     if isinstance(value, (list, tuple)):
-        n = len(value)
-        # CRITICAL: SD 15 silently crashes on SDValueInt2/3/4 applied to float params.
-        # Always use float vectors — int vector params MUST use explicit {"value":..., "type":"int2"}
-        if n == 2:
-            return "float2"
-        if n == 3:
-            return "float3"
-        if n == 4:
-            return "float4"
+        return _INFER_VECTOR.get(len(value), "float")
     return "float"
 
 
@@ -570,29 +807,53 @@ def _coerce_type(inferred_type, value, sd_type_id):
     """
     if not sd_type_id:
         return inferred_type
-    tid = sd_type_id.lower()
+    # The value only matters through its kind — collapse it so the result is cacheable
+    vt = type(value)
+    if vt is int or vt is float:
+        kind = "scalar"
+    elif vt is bool:
+        kind = "bool"
+    elif isinstance(value, (list, tuple)):
+        kind = "vec"
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        kind = "scalar"
+    else:
+        kind = "other"
+    return _coerce_type_cached(inferred_type, kind, sd_type_id.lower())
+
+
+# Exact primitive SD type ids (lower-case) -> value type. For these the SD type
+# alone decides the value type, whatever was inferred from the JSON value.
+_PRIMITIVE_TYPE_IDS = {
+    "int":       "int",
+    "float":     "float",
+    "bool":      "bool",
+    "string":    "string",
+    "float2":    "float2",
+    "float3":    "float3",
+    "float4":    "float4",
+    "int2":      "int2",
+    "int3":      "int3",
+    "int4":      "int4",
+    "colorrgba": "color",
+    "colorrgb":  "float3",
+}
+
 
+@functools.lru_cache(maxsize=1024)
+def _coerce_type_cached(inferred_type, kind, tid):
     # Exact primitive types
-    if tid == "int":        return "int"
-    if tid == "float":      return "float"
-    if tid == "bool":       return "bool"
-    if tid == "string":     return "string"
-    if tid == "float2":     return "float2"
-    if tid == "float3":     return "float3"
-    if tid == "float4":     return "float4"
-    if tid == "int2":       return "int2"
-    if tid == "int3":       return "int3"
-    if tid == "int4":       return "int4"
-    if tid == "colorrgba":  return "color"
-    if tid == "colorrgb":   return "float3"
+    t = _PRIMITIVE_TYPE_IDS.get(tid)
+    if t is not None:
+        return t
 
     # SD enum types (sbs::compositing::blendingmode, sbs::compositing::format, etc.)
     # Enums are integer-based — any non-primitive sd type that accepts an int value
     # SD enum types accept SDValueInt. Coerce float → int for these.
     if tid.startswith("sbs::") or "::" in tid:
-        if inferred_type in ("float",):
+        if inferred_type == "float":
             # Only coerce scalar floats that represent enum/int values
-            if isinstance(value, (int, float)) and not isinstance(value, bool):
+            if kind == "scalar":
                 return "int"
         return inferred_type
 
@@ -600,23 +861,232 @@ def _coerce_type(inferred_type, value, sd_type_id):
     if "int" in tid and "float" not in tid:
         if inferred_type == "float":
             return "int"
-        if inferred_type == "float4" and isinstance(value, (list, tuple)):
+        if inferred_type == "float4" and kind == "vec":
             return "int4"
-        if inferred_type == "float2" and isinstance(value, (list, tuple)):
+        if inferred_type == "float2" and kind == "vec":
             return "int2"
 
     return inferred_type
 
 
+_IDENT_RE = re.compile(r'[^A-Za-z0-9_]')
+
+
 def _sanitize_identifier(name):
     if not name:
         return "MCP_Graph"
-    sanitized = re.sub(r'[^A-Za-z0-9_]', '_', name)
+    return _sanitize_identifier_cached(name)
+
+
+@functools.lru_cache(maxsize=2048)
+def _sanitize_identifier_cached(name):
+    sanitized = _IDENT_RE.sub('_', name)
     if sanitized and not sanitized[0].isalpha():
         sanitized = "G_" + sanitized
     return sanitized or "MCP_Graph"
 
 
+# ── Helper: build SDValues from JSON values ──────────────────────────────────
+# Scalars broadcast to vectors; colors default alpha to 1.0.
+def _vec(value, n):
+    return value if isinstance(value, (list, tuple)) else [value] * n
+
+
+def _mk_color(value):
+    v = value if isinstance(value, (list, tuple)) else [value] * 3 + [1.0]
+    a = float(v[3]) if len(v) > 3 else 1.0
+    return SDValueColorRGBA.sNew(ColorRGBA(float(v[0]), float(v[1]), float(v[2]), a))
+
+
+def _mk_float2(value):
+    v = _vec(value, 2)
+    return SDValueFloat2.sNew(float2(float(v[0]), float(v[1])))
+
+
+def _mk_float3(value):
+    v = _vec(value, 3)
+    return SDValueFloat3.sNew(float3(float(v[0]), float(v[1]), float(v[2])))
+
+
+def _mk_float4(value):
+    v = _vec(value, 4)
+    return SDValueFloat4.sNew(float4(float(v[0]), float(v[1]), float(v[2]), float(v[3])))
+
+
+def _mk_int2(value):
+    v = _vec(value, 2)
+    return SDValueInt2.sNew(int2(int(v[0]), int(v[1])))
+
+
+@functools.lru_cache(maxsize=64)
+def _sd_int2(x, y):
+    """Shared SDValueInt2 for $outputsize-style pairs; SD copies values on set,
+    so the same boxed value can be handed out for every (x, y)."""
+    return SDValueInt2.sNew(int2(x, y))
+
+
+def _mk_int3(value):
+    v = _vec(value, 3)
+    return SDValueInt3.sNew(int3(int(v[0]), int(v[1]), int(v[2])))
+
+
+def _mk_int4(value):
+    v = _vec(value, 4)
+    return SDValueInt4.sNew(int4(int(v[0]), int(v[1]), int(v[2]), int(v[3])))
+
+
+_SD_VALUE_BUILDERS = {
+    "float":     lambda v: SDValueFloat.sNew(float(v)),
+    "int":       lambda v: SDValueInt.sNew(int(v)),
+    "bool":      lambda v: SDValueBool.sNew(bool(v)),
+    "string":    lambda v: SDValueString.sNew(str(v)),
+    "float2":    _mk_float2,
+    "float3":    _mk_float3,
+    "float4":    _mk_float4,
+    "color":     _mk_color,
+    "colorrgba": _mk_color,
+    "int2":      _mk_int2,
+    "int3":      _mk_int3,
+    "int4":      _mk_int4,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_recipe_name(name):
+    """Registry key for a user-typed recipe name ("Rusty Metal" -> "rusty_metal")."""
+    return name.lower().replace(" ", "_").replace("-", "_")
+
+
+@functools.lru_cache(maxsize=1)
+def _recipe_summaries():
+    """list_recipes rows, one per registry entry. The registry is fixed at
+    import, so walking every recipe's node list is done once per session."""
+    return tuple(
+        {
+            "key":         key,
+            "name":        recipe.get("name", key),
+            "category":    recipe.get("category", "unknown"),
+            "description": recipe.get("description", ""),
+            "node_count":  len(recipe.get("nodes", [])),
+            "outputs":     recipe.get("outputs", []),
+        }
+        for key, recipe in RECIPE_REGISTRY.items()
+    )
+
+
+def _warm_recipes():
+    """Build every recipe (and the list_recipes table) before the first request.
+    Recipe building is pure Python, so this runs on its own thread, not Qt's."""
+    if RECIPE_REGISTRY is None:
+        return
+    try:
+        _recipe_summaries()
+    except Exception as e:
+        _log("Warning: recipe warm-up failed: {}", e)
+
+
+@functools.lru_cache(maxsize=256)
+def _sd_type_ctor(sd_type_id):
+    """SDValue builder fully determined by a primitive SD type id, else None
+    (enums / unknown ids still need _infer_type + _coerce_type)."""
+    t = _PRIMITIVE_TYPE_IDS.get(sd_type_id.lower())
+    return _SD_VALUE_BUILDERS[t] if t is not None else None
+
+
+# Resource class names are a small fixed set: decide each one once, then every
+# later probe is a dict hit instead of a substring scan.
+@functools.lru_cache(maxsize=64)
+def _is_comp_graph_class(cname):
+    return "SDSBSCompGraph" in cname
+
+
+@functools.lru_cache(maxsize=64)
+def _is_graph_class(cname):
+    return "CompGraph" in cname or "SDGraph" in cname
+
+
+def _safe_type_id(prop):
+    """SD type id of a property, "" when it has none or the lookup fails."""
+    try:
+        t = prop.getType()
+        return sys.intern(t.getId()) if t else ""
+    except Exception:
+        return ""
+
+
+def _sd_len(arr):
+    """Element count of an SDArray without materializing it as a list."""
+    try:
+        return arr.getSize()
+    except AttributeError:
+        return len(list(arr))
+
+
+def _is_instance_def(defn_id):
+    """True for library/instance node definitions (vs. sbs:: atomics)."""
+    return (defn_id == "unknown" or
+            defn_id.startswith("pkg://") or
+            "?dependency=" in defn_id)
+
+
+def _unique_alias(alias, taken, next_suffix):
+    """alias, or alias_<n> with the first free n. Taken suffixes never come
+    back, so each base resumes from its last suffix instead of probing from 1."""
+    if alias not in taken:
+        return alias
+    n = next_suffix.get(alias, 0)
+    while True:
+        n += 1
+        candidate = "{}_{}".format(alias, n)
+        if candidate not in taken:
+            next_suffix[alias] = n
+            return candidate
+
+
+def _unmatched_overrides(specs, overrides):
+    """Override aliases that name no spec (typos would otherwise be silently
+    ignored). One pass builds the alias index, one pass checks the overrides."""
+    if not overrides:
+        return []
+    aliases = {spec.get("id_alias") for spec in specs}
+    return sorted(a for a in overrides if a not in aliases)
+
+
+# ── Helper: serialize raw SD values to JSON ──────────────────────────────────
+def _ser_array(raw):
+    items = []
+    try:
+        for i in range(raw.getSize()):
+            item = raw.getItem(i)
+            items.append(str(item.get()) if hasattr(item, 'get') else str(item))
+    except Exception:
+        return str(raw)
+    return items
+
+
+def _pick_serializer(raw):
+    """Decide once per type how its values serialize (SD value types have a
+    fixed attribute layout, so the hasattr probes only need to run once)."""
+    if hasattr(raw, 'x') and hasattr(raw, 'y'):
+        fields = tuple(f for f in ('x', 'y', 'z', 'w') if hasattr(raw, f))
+        return lambda r: {f: getattr(r, f) for f in fields}
+    if hasattr(raw, 'r') and hasattr(raw, 'g'):
+        return lambda r: {"r": r.r, "g": r.g, "b": r.b, "a": r.a}
+    if hasattr(raw, 'getSize') and hasattr(raw, 'getItem'):
+        return _ser_array
+    return str
+
+
+_RAW_SERIALIZERS = {}   # type(raw) -> serializer, filled lazily
+
+
+def _serialize_raw(raw):
+    fn = _RAW_SERIALIZERS.get(type(raw))
+    if fn is None:
+        fn = _RAW_SERIALIZERS[type(raw)] = _pick_serializer(raw)
+    return fn(raw)
+
+
 # ════════════════════════════════════════════════════════════════════════════
 # COMMAND HANDLER — the brain of the plugin
 # ════════════════════════════════════════════════════════════════════════════
@@ -667,40 +1137,165 @@ class CommandHandler:
         }
         # Library node URL cache (populated lazily, session-lifetime)
         self._lib_url_cache = {}  # lower-case identifier -> url string
+        # Flat library index (session-lifetime, rebuilt on a miss):
+        # [(identifier, identifier.lower(), url, package file name), ...]
+        self._lib_entries = None
+        self._url_resource_cache = {}   # pkg:// url -> SDResource (session-lifetime)
+        self._graph_by_id = {}          # graph identifier -> (package path, resource)
+        # Connectable input ids per atomic definition (session-lifetime). Keyed
+        # with the node's input count, since some atomics grow inputs per node;
+        # instances of editable graphs and variadic definitions are never cached.
+        self._connectable_cache = {}    # (definition id, input count) -> tuple of input ids
+        self._default_port_cache = {}   # (library url, "in"|"out") -> smart_connect port
+        # Negative cache for _resolve_lib_url: keyword -> package epoch of the miss
+        self._lib_misses = {}
+        self._pkg_epoch  = 0            # bumped whenever this handler changes packages
+        # Node definition ids per graph class (session-lifetime). Every comp graph
+        # exposes the same atomic set, so fresh batch graphs hit the cache too.
+        self._defn_id_cache = {}        # class name -> (ordered tuple, frozenset)
+        # Identifier -> node index for _find_node fallback (command-lifetime).
+        # Keyed by id(graph); the graph wrapper is kept alive alongside its
+        # index so the id cannot be recycled while the entry exists.
+        self._node_index = {}     # id(graph) -> (graph, {identifier: node})
+        # Per-command memo of package/resource listings (cleared in dispatch and
+        # whenever a command adds or removes packages/graphs)
+        self._cmd_cache = {}
+        # Per-node property id -> SD type id maps (command-lifetime, same keying
+        # scheme as _node_index): id(node) -> (node, {"in"|"out"|"annot": {...}})
+        self._node_prop_cache = {}
+        self._app_cache     = None
+        self._pkg_mgr_cache = None
+        self._ui_mgr_cache  = None
+        self._sd_version_cache = None   # first successful getVersion() result
 
     def dispatch(self, cmd_type, params):
         handler = self.HANDLERS.get(cmd_type)
         if not handler:
             raise ValueError("Unknown command: '{}'. Available: {}".format(
                 cmd_type, sorted(self.HANDLERS.keys())))
+        # Node wrappers from a previous command may be stale (execute_code, UI edits)
+        self._node_index.clear()
+        self._node_prop_cache.clear()
+        self._cmd_cache.clear()
         return handler(**params)
 
     # ═══════════════════════════════════════════════════════════════════════
     # ── SD API helpers ──────────────────────────────────────────────────
     # ═══════════════════════════════════════════════════════════════════════
 
+    # Application / managers are process-wide singletons in SD: resolve once
+    # per handler (a plugin reload builds a new handler anyway).
     def _app(self):
-        return sd.getContext().getSDApplication()
+        if self._app_cache is None:
+            self._app_cache = sd.getContext().getSDApplication()
+        return self._app_cache
 
     def _pkg_mgr(self):
-        return self._app().getPackageMgr()
+        if self._pkg_mgr_cache is None:
+            self._pkg_mgr_cache = self._app().getPackageMgr()
+        return self._pkg_mgr_cache
 
     def _ui_mgr(self):
-        return self._app().getUIMgr()
+        if self._ui_mgr_cache is None:
+            self._ui_mgr_cache = self._app().getUIMgr()
+        return self._ui_mgr_cache
+
+    # ── Per-command resource listings ──
+    def _user_packages(self):
+        pkgs = self._cmd_cache.get("user_packages")
+        if pkgs is None:
+            pkgs = self._cmd_cache["user_packages"] = list(self._pkg_mgr().getUserPackages())
+        return pkgs
+
+    def _all_packages(self):
+        """User + library packages, listed once per command."""
+        pkgs = self._cmd_cache.get("all_packages")
+        if pkgs is None:
+            pkgs = self._cmd_cache["all_packages"] = list(self._pkg_mgr().getPackages())
+        return pkgs
+
+    def _children(self, pkg):
+        # Keyed by id(pkg); the wrapper is stored with the list so the id stays valid
+        children = self._cmd_cache.setdefault("children", {})
+        entry = children.get(id(pkg))
+        if entry is None or entry[0] is not pkg:
+            entry = children[id(pkg)] = (pkg, list(pkg.getChildrenResources(False)))
+        return entry[1]
+
+    def _graph_node_count(self, graph, pkg_path=None):
+        """Node count of a graph, counted once per command. Keyed by package
+        path + identifier so the current-graph wrapper hits the package scan."""
+        counts = self._cmd_cache.setdefault("node_counts", {})
+        if pkg_path is None:
+            try:
+                pkg_path = graph.getPackage().getFilePath()
+            except Exception:
+                pkg_path = None
+        # Unsaved packages all report "" — never share counts between them
+        key = (pkg_path, graph.getIdentifier()) if pkg_path else None
+        n = counts.get(key) if key else None
+        if n is None:
+            n = _sd_len(graph.getNodes())
+            if key:
+                counts[key] = n
+        return n
+
+    def _packages_by_path(self):
+        index = self._cmd_cache.get("pkgs_by_path")
+        if index is None:
+            index = {}
+            for pkg in self._user_packages():
+                try:
+                    index.setdefault(pkg.getFilePath(), pkg)
+                except Exception:
+                    continue
+            self._cmd_cache["pkgs_by_path"] = index
+        return index
+
+    def _graph_entry(self, graph_identifier):
+        """(package file path, resource) for a graph identifier, or None.
+        Session-lifetime index; a stale hit (renamed/deleted in SD's UI) is
+        detected by re-reading the identifier and triggers one rebuild."""
+        entry = self._graph_by_id.get(graph_identifier)
+        if entry is not None:
+            try:
+                if entry[1].getIdentifier() == graph_identifier:
+                    return entry
+            except Exception:
+                pass
+        index = {}
+        for pkg in self._user_packages():
+            try:
+                path = pkg.getFilePath()
+            except Exception:
+                path = ""
+            for res in self._children(pkg):
+                try:
+                    index.setdefault(res.getIdentifier(), (path, res))
+                except Exception:
+                    continue
+        self._graph_by_id = index
+        return index.get(graph_identifier)
+
+    def _invalidate_resources(self):
+        self._cmd_cache.clear()
 
     def _get_sd_version(self):
-        try:
-            return self._app().getVersion()
-        except Exception:
-            return "unknown"
+        # The running SD build cannot change mid-session; failures are not cached
+        if self._sd_version_cache is None:
+            try:
+                self._sd_version_cache = self._app().getVersion()
+            except Exception:
+                return "unknown"
+        return self._sd_version_cache
 
     def _resolve_package(self, package_index=0, package_path=None):
-        pkgs = list(self._pkg_mgr().getUserPackages())
         if package_path:
-            for pkg in pkgs:
-                if pkg.getFilePath() == package_path:
-                    return pkg
+            pkg = self._packages_by_path().get(package_path)
+            if pkg is not None:
+                return pkg
             raise ValueError("Package '{}' not found.".format(package_path))
+        pkgs = self._user_packages()
         if not pkgs:
             raise ValueError("No user packages loaded. Open a .sbs file first.")
         if package_index < 0:
@@ -712,13 +1307,9 @@ class CommandHandler:
 
     def _resolve_graph(self, graph_identifier=None):
         if graph_identifier:
-            for pkg in list(self._pkg_mgr().getUserPackages()):
-                for res in list(pkg.getChildrenResources(False)):
-                    try:
-                        if res.getIdentifier() == graph_identifier:
-                            return res
-                    except Exception:
-                        continue
+            entry = self._graph_entry(graph_identifier)
+            if entry is not None:
+                return entry[1]
             raise ValueError("Graph '{}' not found.".format(graph_identifier))
 
         try:
@@ -728,10 +1319,10 @@ class CommandHandler:
         except Exception:
             pass
 
-        for pkg in list(self._pkg_mgr().getUserPackages()):
-            for res in list(pkg.getChildrenResources(False)):
+        for pkg in self._user_packages():
+            for res in self._children(pkg):
                 try:
-                    if "SDSBSCompGraph" in res.getClassName():
+                    if _is_comp_graph_class(res.getClassName()):
                         return res
                 except Exception:
                     continue
@@ -745,12 +1336,66 @@ class CommandHandler:
                 return n
         except Exception:
             pass
-        for node in list(graph.getNodes()):
-            if node.getIdentifier() == node_id:
-                return node
+        entry = self._node_index.get(id(graph))
+        if entry is not None and entry[0] is graph:
+            n = entry[1].get(node_id)
+            if n is not None:
+                return n
+        # Miss (or nodes created since the last build): index the graph once
+        index = {}
+        for node in graph.getNodes():
+            try:
+                index[node.getIdentifier()] = node
+            except Exception:
+                continue
+        self._node_index[id(graph)] = (graph, index)
+        n = index.get(node_id)
+        if n is not None:
+            return n
         raise ValueError("Node '{}' not found in graph '{}'.".format(
             node_id, graph.getIdentifier()))
 
+    def _index_node(self, graph, node):
+        """Record a newly created node in graph's index (if one was built).
+        Returns the node's identifier."""
+        nid = node.getIdentifier()
+        entry = self._node_index.get(id(graph))
+        if entry is not None and entry[0] is graph:
+            entry[1][nid] = node
+        return nid
+
+    def _unindex_node(self, graph, node_id):
+        entry = self._node_index.get(id(graph))
+        if entry is not None and entry[0] is graph:
+            entry[1].pop(node_id, None)
+
+    def _definition_ids(self, graph):
+        """(ordered tuple, frozenset) of the definition ids available in graph.
+        Ids are interned, so lookups with the recipes' interned ids match by identity."""
+        try:
+            key = graph.getClassName()
+        except Exception:
+            key = None
+        entry = self._defn_id_cache.get(key) if key else None
+        if entry is None:
+            ids = []
+            for d in graph.getNodeDefinitions():
+                try:
+                    ids.append(sys.intern(d.getId()))
+                except Exception:
+                    pass
+            entry = (tuple(ids), frozenset(ids))
+            if key and ids:
+                self._defn_id_cache[key] = entry
+        return entry
+
+    def _known_defs(self, graph):
+        """Definition-id set used to validate batch specs (empty = don't check)."""
+        try:
+            return self._definition_ids(graph)[1]
+        except Exception:
+            return frozenset()
+
     def _get_node_def_id(self, node):
         try:
             defn = node.getDefinition()
@@ -760,12 +1405,6 @@ class CommandHandler:
             pass
         return "unknown"
 
-    def _is_instance_node(self, node):
-        defn_id = self._get_node_def_id(node)
-        return (defn_id == "unknown" or
-                defn_id.startswith("pkg://") or
-                "?dependency=" in defn_id)
-
     def _get_node_pos(self, node):
         try:
             p = node.getPosition()
@@ -774,79 +1413,114 @@ class CommandHandler:
             return [0.0, 0.0]
 
     def _make_sd_value(self, value_type, value):
-        t = value_type.lower()
-        if t == "float":
-            return SDValueFloat.sNew(float(value))
-        if t == "int":
-            return SDValueInt.sNew(int(value))
-        if t == "bool":
-            return SDValueBool.sNew(bool(value))
-        if t == "string":
-            return SDValueString.sNew(str(value))
-        if t == "float2":
-            v = value if isinstance(value, (list, tuple)) else [value, value]
-            return SDValueFloat2.sNew(float2(float(v[0]), float(v[1])))
-        if t == "float3":
-            v = value if isinstance(value, (list, tuple)) else [value] * 3
-            return SDValueFloat3.sNew(float3(float(v[0]), float(v[1]), float(v[2])))
-        if t == "float4":
-            v = value if isinstance(value, (list, tuple)) else [value] * 4
-            return SDValueFloat4.sNew(float4(
-                float(v[0]), float(v[1]), float(v[2]), float(v[3])))
-        if t in ("color", "colorrgba"):
-            v = value if isinstance(value, (list, tuple)) else [value] * 3 + [1.0]
-            a = float(v[3]) if len(v) > 3 else 1.0
-            return SDValueColorRGBA.sNew(ColorRGBA(
-                float(v[0]), float(v[1]), float(v[2]), a))
-        if t == "int2":
-            v = value if isinstance(value, (list, tuple)) else [value, value]
-            return SDValueInt2.sNew(int2(int(v[0]), int(v[1])))
-        if t == "int3":
-            v = value if isinstance(value, (list, tuple)) else [value] * 3
-            return SDValueInt3.sNew(int3(int(v[0]), int(v[1]), int(v[2])))
-        if t == "int4":
-            v = value if isinstance(value, (list, tuple)) else [value] * 4
-            return SDValueInt4.sNew(int4(int(v[0]), int(v[1]), int(v[2]), int(v[3])))
-        raise ValueError(
-            "Unknown value_type '{}'. Valid: float, int, bool, string, "
-            "float2, float3, float4, color, int2, int3, int4".format(value_type))
-
-    def _resolve_lib_url(self, keyword):
-        """Find a library node URL by keyword (case-insensitive). Cached."""
-        key = keyword.lower()
-        if key in self._lib_url_cache:
-            return self._lib_url_cache[key]
-        for pkg in list(self._pkg_mgr().getPackages()):
+        # Exact hit first (types are almost always already lower-case)
+        builder = _SD_VALUE_BUILDERS.get(value_type) or _SD_VALUE_BUILDERS.get(value_type.lower())
+        if builder is None:
+            raise ValueError(
+                "Unknown value_type '{}'. Valid: float, int, bool, string, "
+                "float2, float3, float4, color, int2, int3, int4".format(value_type))
+        return builder(value)
+
+    def _build_lib_index(self):
+        """Walk every package once and index its comp graphs by identifier.
+        The walk also seeds _find_resource's url -> resource cache, so library
+        instances don't need a findResourceFromUrl scan over every package."""
+        entries = []
+        resources = {}
+        for pkg in self._all_packages():
             try:
                 fp = pkg.getFilePath()
                 if not fp:
                     continue
-                for recursive in (True, False):
-                    try:
-                        children = list(pkg.getChildrenResources(recursive))
-                        if not children:
-                            continue
-                        for res in children:
-                            try:
-                                if "SDSBSCompGraph" not in res.getClassName():
-                                    continue
-                                rid = res.getIdentifier()
-                                if key in rid.lower():
-                                    url = None
-                                    try:
-                                        url = res.getUrl()
-                                    except Exception:
-                                        pass
-                                    if url:
-                                        self._lib_url_cache[key] = url
-                                        # also cache by exact identifier
-                                        self._lib_url_cache[rid.lower()] = url
-                                        return url
-                            except Exception:
-                                pass
-                        break
-                    except Exception:
+                try:
+                    children = list(pkg.getChildrenResources(True))
+                except Exception:
+                    # Older SD builds only accept the non-recursive form
+                    children = list(pkg.getChildrenResources(False))
+                if not children:
+                    continue
+                pkg_name = os.path.basename(fp)
+            except Exception:
+                continue
+            for res in children:
+                try:
+                    if not _is_comp_graph_class(res.getClassName()):
                         continue
+                    rid = res.getIdentifier()
+                    url = res.getUrl()
+                except Exception:
+                    continue
+                if url:
+                    entries.append((rid, rid.lower(), url, pkg_name))
+                    resources.setdefault(url, res)   # first package wins, as in the scan
+        self._url_resource_cache.update(resources)
+        self._lib_entries = entries
+        self._lib_url_cache = {}
+        for _rid, rid_l, url, _pkg in entries:
+            self._lib_url_cache.setdefault(rid_l, url)
+        return entries
+
+    def _invalidate_lib_index(self):
+        self._lib_entries = None
+        self._lib_url_cache = {}
+        self._pkg_epoch += 1
+
+    def _lib_epoch(self):
+        # Packages opened from SD's UI don't go through this handler: the package
+        # count catches those.
+        try:
+            n = len(self._all_packages())
+        except Exception:
+            n = -1
+        return (self._pkg_epoch, n)
+
+    def _match_lib_url(self, key):
+        # Exact identifier first, then first substring match in package order
+        url = self._lib_url_cache.get(key)
+        if url is None:
+            url = next((u for _r, rid_l, u, _p in self._lib_entries if key in rid_l), None)
+            if url:
+                self._lib_url_cache[key] = url
+        return url
+
+    def _resolve_lib_url(self, keyword):
+        """Find a library node URL by keyword (case-insensitive). Cached."""
+        key = keyword.lower()
+        url = self._lib_url_cache.get(key)
+        if url:
+            return url
+        epoch = self._lib_epoch()
+        if self._lib_misses.get(key) == epoch:
+            return None   # already searched for, nothing loaded since
+        fresh = self._lib_entries is None
+        if fresh:
+            self._build_lib_index()
+        url = self._match_lib_url(key)
+        if url is None and not fresh:
+            # Packages may have been loaded since the index was built: rebuild once
+            self._build_lib_index()
+            url = self._match_lib_url(key)
+        if url is None:
+            self._lib_misses[key] = epoch
+        return url
+
+    def _find_resource(self, url):
+        """Resource for a pkg:// URL across all loaded packages. Cached for the
+        session; a cached resource is re-validated before reuse."""
+        res = self._url_resource_cache.get(url)
+        if res is not None:
+            try:
+                if res.getUrl() == url:
+                    return res
+            except Exception:
+                pass
+            del self._url_resource_cache[url]
+        for pkg in self._all_packages():
+            try:
+                r = pkg.findResourceFromUrl(url)
+                if r is not None:
+                    self._url_resource_cache[url] = r
+                    return r
             except Exception:
                 pass
         return None
@@ -858,15 +1532,7 @@ class CommandHandler:
             raise ValueError(
                 "Library node '{}' not found. "
                 "Use get_library_nodes(filter_text='{}') to verify.".format(keyword, keyword))
-        resource = None
-        for pkg in list(self._pkg_mgr().getPackages()):
-            try:
-                r = pkg.findResourceFromUrl(url)
-                if r is not None:
-                    resource = r
-                    break
-            except Exception:
-                pass
+        resource = self._find_resource(url)
         if not resource:
             raise ValueError("Resource URL not found: {}".format(url))
         node = graph.newInstanceNode(resource)
@@ -876,6 +1542,96 @@ class CommandHandler:
             node.setPosition(float2(float(position[0]), float(position[1])))
         return node
 
+    def _prop_map(self, node, kind):
+        """{property id: SD type id} for one category ("in", "out", "annot").
+        Each category is walked at most once per node per command."""
+        entry = self._node_prop_cache.get(id(node))
+        if entry is None or entry[0] is not node:
+            entry = self._node_prop_cache[id(node)] = (node, {})
+        maps = entry[1]
+        m = maps.get(kind)
+        if m is None:
+            try:
+                m = {sys.intern(p.getId()): _safe_type_id(p)
+                     for p in node.getProperties(_PROP_CATEGORIES[kind])}
+            except Exception:
+                m = {}
+            maps[kind] = m
+        return m
+
+    def _connectable_inputs(self, node, defn_id):
+        """Input ids that can carry a connection, or None when the SD build
+        doesn't expose isConnectable (callers then scan every input)."""
+        try:
+            props = node.getProperties(SDPropertyCategory.Input)
+        except Exception:
+            return None
+        cacheable = defn_id.startswith("sbs::")
+        key = (defn_id, _sd_len(props))
+        if cacheable:
+            ports = self._connectable_cache.get(key)
+            if ports is not None:
+                return ports
+        ids = []
+        try:
+            for prop in props:
+                if prop.isVariadic():
+                    cacheable = False
+                if prop.isConnectable():
+                    ids.append(sys.intern(prop.getId()))
+        except Exception:
+            return None
+        ports = tuple(ids)
+        if cacheable:
+            self._connectable_cache[key] = ports
+        return ports
+
+    def _default_port(self, node, defn_id, kind):
+        """First output ("out") or first non-system input ("in") of a library
+        node. Remembered across smart_connect calls only for library packages
+        (?dependency= URLs): instances of graphs open in this session can be
+        edited, so their ports are read from the node every time."""
+        cacheable = "?dependency=" in defn_id
+        key  = (defn_id, kind)
+        port = self._default_port_cache.get(key) if cacheable else None
+        if port is None:
+            ports = self._prop_map(node, kind)
+            if kind == "in":
+                port = next((pid for pid in ports if pid not in _SYSTEM_PARAMS), None)
+            else:
+                port = next(iter(ports), None)
+            if port is not None and cacheable:
+                self._default_port_cache[key] = port
+        return port
+
+    def _input_connections(self, node, defn_id):
+        """[(input id, source node id, source output id)] for node's inputs.
+        Only connectable ports are queried — parameters never carry edges."""
+        ports  = self._connectable_inputs(node, defn_id)
+        cat_in = SDPropertyCategory.Input
+        if ports is None:
+            pairs = ((None, prop) for prop in node.getProperties(cat_in))
+        else:
+            get_prop = node.getPropertyFromId
+            pairs = ((pid, get_prop(pid, cat_in)) for pid in ports)
+        get_conns = node.getPropertyConnections
+        edges = []
+        for pid, prop in pairs:
+            if prop is None:
+                continue
+            conns = get_conns(prop)
+            if not conns:
+                continue
+            if pid is None:
+                pid = prop.getId()
+            for conn in conns:
+                sn = conn.getInputPropertyNode()
+                sp = conn.getInputProperty()
+                if sn is None or sp is None:
+                    continue
+                edges.append((pid, sn.getIdentifier(), sp.getId()))
+        return edges
+
     def _set_node_params(self, node, params):
         """Apply parameter dict to a node. Type-safe: reads actual SD property type
         and coerces before setting to prevent SD 15 silent crashes."""
@@ -883,29 +1639,9 @@ class CommandHandler:
             return {}
         results = {}
 
-        # Build property type maps: id -> SDType id string
-        input_type_map  = {}   # param_id -> sd_type_id
-        annot_type_map  = {}
-        try:
-            for p in list(node.getProperties(SDPropertyCategory.Input)):
-                pid = p.getId()
-                try:
-                    t = p.getType()
-                    input_type_map[pid] = t.getId() if t else ""
-                except Exception:
-                    input_type_map[pid] = ""
-        except Exception:
-            pass
-        try:
-            for p in list(node.getProperties(SDPropertyCategory.Annotation)):
-                pid = p.getId()
-                try:
-                    t = p.getType()
-                    annot_type_map[pid] = t.getId() if t else ""
-                except Exception:
-                    annot_type_map[pid] = ""
-        except Exception:
-            pass
+        # Property type maps: id -> SDType id string
+        input_type_map = self._prop_map(node, "in")
+        annot_type_map = self._prop_map(node, "annot")
 
         for param_id, param_spec in params.items():
             # Skip system params — they cannot be set as node inputs safely
@@ -913,27 +1649,40 @@ class CommandHandler:
                 results[param_id] = "skipped_system"
                 continue
             try:
-                if isinstance(param_spec, dict) and "value" in param_spec:
+                if isinstance(param_spec, Mapping) and "value" in param_spec:
                     pval  = param_spec["value"]
-                    ptype = param_spec.get("type", _infer_type(pval))
+                    ptype = param_spec.get("type")
+                    pcat  = param_spec.get("category")
                 else:
                     pval  = param_spec
-                    ptype = _infer_type(pval)
-
-                # Coerce ptype to match actual SD property type (prevents silent crash)
-                sd_type_id = (input_type_map.get(param_id)
-                              or annot_type_map.get(param_id) or "")
-                ptype = _coerce_type(ptype, pval, sd_type_id)
-
-                sd_val = self._make_sd_value(ptype, pval)
+                    ptype = None
+                    pcat  = None
+                if pcat not in (None, "input", "annotation"):
+                    raise ValueError("category must be 'input', 'annotation' or omitted.")
+                # An explicit category limits the lookup and the setter tried
+                in_input = pcat != "annotation" and param_id in input_type_map
+                in_annot = pcat != "input" and param_id in annot_type_map
+
+                sd_type_id = ((in_input and input_type_map[param_id])
+                              or (in_annot and annot_type_map[param_id]) or "")
+                # Primitive SD types pick the SDValue directly; otherwise coerce
+                # the inferred type to the actual SD property type (prevents silent crash)
+                ctor = _sd_type_ctor(sd_type_id) if sd_type_id else None
+                if ctor is not None:
+                    sd_val = ctor(pval)
+                else:
+                    if ptype is None:
+                        ptype = _infer_type(pval)
+                    ptype = _coerce_type(ptype, pval, sd_type_id)
+                    sd_val = self._make_sd_value(ptype, pval)
                 set_ok = False
-                if param_id in input_type_map:
+                if in_input:
                     try:
                         node.setInputPropertyValueFromId(param_id, sd_val)
                         set_ok = True
                     except Exception:
                         pass
-                if not set_ok and param_id in annot_type_map:
+                if not set_ok and in_annot:
                     try:
                         node.setAnnotationPropertyValueFromId(param_id, sd_val)
                         set_ok = True
@@ -946,29 +1695,19 @@ class CommandHandler:
 
     def _safe_connect(self, graph, from_node, from_out, to_node, to_in):
         """Connect nodes with port validation. Returns True on success."""
-        out_ids = set()
-        in_ids  = set()
-        try:
-            for p in list(from_node.getProperties(SDPropertyCategory.Output)):
-                out_ids.add(p.getId())
-        except Exception:
-            pass
-        try:
-            for p in list(to_node.getProperties(SDPropertyCategory.Input)):
-                pid = p.getId()
-                if pid not in _SYSTEM_PARAMS:
-                    in_ids.add(pid)
-        except Exception:
-            pass
+        out_ids = self._prop_map(from_node, "out")
+        in_map  = self._prop_map(to_node, "in")
 
         if out_ids and from_out not in out_ids:
             raise ValueError(
                 "Output port '{}' not found on node '{}'. "
                 "Available: {}".format(from_out, from_node.getIdentifier(), sorted(out_ids)))
-        if in_ids and to_in not in in_ids:
-            raise ValueError(
-                "Input port '{}' not found on node '{}'. "
-                "Available: {}".format(to_in, to_node.getIdentifier(), sorted(in_ids)))
+        if in_map and (to_in not in in_map or to_in in _SYSTEM_PARAMS):
+            in_ids = sorted(pid for pid in in_map if pid not in _SYSTEM_PARAMS)
+            if in_ids:
+                raise ValueError(
+                    "Input port '{}' not found on node '{}'. "
+                    "Available: {}".format(to_in, to_node.getIdentifier(), in_ids))
 
         conn = from_node.newPropertyConnectionFromId(from_out, to_node, to_in)
         if conn is None:
@@ -992,30 +1731,31 @@ class CommandHandler:
             current_graph_id = None
 
         pkg_list = []
-        for pkg in list(pkg_mgr.getUserPackages()):
+        for pkg in pkg_mgr.getUserPackages():
             try:
+                fp = pkg.getFilePath()
                 graphs = []
-                for res in list(pkg.getChildrenResources(False)):
+                for res in pkg.getChildrenResources(False):
                     try:
                         cname = res.getClassName()
                         rid   = res.getIdentifier()
                         nc    = 0
-                        if "CompGraph" in cname or "SDGraph" in cname:
+                        if _is_graph_class(cname):
                             try:
-                                nc = len(list(res.getNodes()))
+                                nc = self._graph_node_count(res, fp)
                             except Exception:
                                 pass
                         graphs.append({"identifier": rid, "type": cname, "node_count": nc})
                     except Exception:
                         pass
-                pkg_list.append({"file_path": pkg.getFilePath(), "graphs": graphs})
+                pkg_list.append({"file_path": fp, "graphs": graphs})
             except Exception as e:
                 pkg_list.append({"error": str(e)})
 
         current_nc = 0
         if current_graph is not None:
             try:
-                current_nc = len(list(current_graph.getNodes()))
+                current_nc = self._graph_node_count(current_graph)
             except Exception:
                 pass
 
@@ -1030,6 +1770,8 @@ class CommandHandler:
 
     def create_package(self, file_path=None):
         pkg = self._pkg_mgr().newUserPackage()
+        self._invalidate_resources()
+        self._invalidate_lib_index()
         return {
             "file_path": pkg.getFilePath(),
             "message": "New package created. Use save_package to save it.",
@@ -1040,7 +1782,9 @@ class CommandHandler:
         pkg = self._resolve_package(package_index, package_path)
         new_graph = SDSBSCompGraph.sNew(pkg)
         new_graph.setIdentifier(safe_name)
+        self._invalidate_resources()
         actual_id = new_graph.getIdentifier()
+        self._graph_by_id.setdefault(actual_id, (pkg.getFilePath(), new_graph))
         return {
             "identifier": actual_id,
             "requested_name": graph_name,
@@ -1051,10 +1795,23 @@ class CommandHandler:
 
     def delete_graph(self, graph_identifier, package_index=0):
         pkg = self._resolve_package(package_index)
-        for res in list(pkg.getChildrenResources(False)):
+        # Index hit — only trusted when the package is unambiguous (saved, same path)
+        entry = self._graph_entry(graph_identifier)
+        if entry is not None:
+            path = pkg.getFilePath()
+            if path and entry[0] == path:
+                entry[1].delete()
+                self._graph_by_id.pop(graph_identifier, None)
+                self._invalidate_resources()
+                self._url_resource_cache.clear()
+                return {"deleted": graph_identifier}
+        for res in self._children(pkg):
             try:
                 if res.getIdentifier() == graph_identifier:
                     res.delete()
+                    self._graph_by_id.pop(graph_identifier, None)
+                    self._invalidate_resources()
+                    self._url_resource_cache.clear()
                     return {"deleted": graph_identifier}
             except Exception:
                 pass
@@ -1077,31 +1834,20 @@ class CommandHandler:
         node_list = []
         for node in to_detail:
             try:
+                defn_id = self._get_node_def_id(node)
                 info = {
                     "identifier": node.getIdentifier(),
-                    "definition":  self._get_node_def_id(node),
+                    "definition":  defn_id,
                     "position":    self._get_node_pos(node),
                     "connections": [],
                 }
                 if include_connections:
+                    # One handler per node, not per property/connection
                     try:
-                        for prop in list(node.getProperties(SDPropertyCategory.Input)):
-                            pid   = prop.getId()
-                            conns = node.getPropertyConnections(prop)
-                            if conns is None:
-                                continue
-                            for conn in list(conns):
-                                try:
-                                    sn = conn.getInputPropertyNode()
-                                    sp = conn.getInputProperty()
-                                    if sn and sp:
-                                        info["connections"].append({
-                                            "input":       pid,
-                                            "from_node":   sn.getIdentifier(),
-                                            "from_output": sp.getId(),
-                                        })
-                                except Exception:
-                                    pass
+                        info["connections"] = [
+                            {"input": pid, "from_node": src, "from_output": out}
+                            for pid, src, out in self._input_connections(node, defn_id)
+                        ]
                     except Exception:
                         pass
                 node_list.append(info)
@@ -1127,6 +1873,10 @@ class CommandHandler:
                 except Exception as e:
                     raise ValueError("Cannot create directory '{}': {}".format(target_dir, e))
             pkg_mgr.savePackageAs(pkg, file_path)
+            self._invalidate_resources()   # file path changed
+            self._invalidate_lib_index()
+            self._graph_by_id = {}
+            self._url_resource_cache.clear()
             return {"saved_to": file_path}
         else:
             current_path = pkg.getFilePath()
@@ -1146,33 +1896,28 @@ class CommandHandler:
             "nodes": [],
             "connections": [],
         }
-        for node in all_nodes:
-            nid  = node.getIdentifier()
-            defn = self._get_node_def_id(node)
-            pos  = self._get_node_pos(node)
-            snapshot["nodes"].append({
-                "id": nid, "definition": defn, "position": pos,
-                "is_library": self._is_instance_node(node),
-            })
+        # Pass 1 — node attributes as parallel columns (one SD call kind per loop)
+        ids       = [node.getIdentifier() for node in all_nodes]
+        defs      = [self._get_node_def_id(node) for node in all_nodes]
+        positions = [self._get_node_pos(node) for node in all_nodes]
+        snapshot["nodes"] = [
+            {"id": nid, "definition": defn, "position": pos,
+             "is_library": _is_instance_def(defn)}
+            for nid, defn, pos in zip(ids, defs, positions)
+        ]
+
+        # Pass 2 — connections, reusing the identifiers from pass 1
+        connections = snapshot["connections"]
+        for node, nid, defn in zip(all_nodes, ids, defs):
+            # One handler per node, not per property/connection
             try:
-                for prop in list(node.getProperties(SDPropertyCategory.Input)):
-                    pid   = prop.getId()
-                    conns = node.getPropertyConnections(prop)
-                    if conns is None:
-                        continue
-                    for conn in list(conns):
-                        try:
-                            sn = conn.getInputPropertyNode()
-                            sp = conn.getInputProperty()
-                            if sn and sp:
-                                snapshot["connections"].append({
-                                    "from_node": sn.getIdentifier(),
-                                    "from_output": sp.getId(),
-                                    "to_node": nid,
-                                    "to_input": pid,
-                                })
-                        except Exception:
-                            pass
+                for pid, src, out in self._input_connections(node, defn):
+                    connections.append({
+                        "from_node": src,
+                        "from_output": out,
+                        "to_node": nid,
+                        "to_input": pid,
+                    })
             except Exception:
                 pass
         return snapshot
@@ -1213,7 +1958,7 @@ class CommandHandler:
             g = self._ui_mgr().getCurrentGraph()
             if g:
                 results["current_graph"] = g.getIdentifier()
-                results["current_graph_nodes"] = len(list(g.getNodes()))
+                results["current_graph_nodes"] = self._graph_node_count(g)
             else:
                 results["current_graph"] = None
         except Exception as e:
@@ -1239,31 +1984,31 @@ class CommandHandler:
                 if not graph:
                     pkgs = list(self._pkg_mgr().getUserPackages())
                     if pkgs:
-                        rs = list(pkgs[0].getChildrenResources(False))
-                        for r in rs:
+                        for r in pkgs[0].getChildrenResources(False):
                             try:
-                                if "SDSBSCompGraph" in r.getClassName():
+                                if _is_comp_graph_class(r.getClassName()):
                                     graph = r
                                     break
                             except Exception:
                                 pass
-                if not graph:
+                # A cached comp-graph set makes the throwaway package unnecessary
+                if not graph and "SDSBSCompGraph" not in self._defn_id_cache:
                     temp_pkg = self._pkg_mgr().newUserPackage()
                     graph = SDSBSCompGraph.sNew(temp_pkg)
                     graph.setIdentifier("_TempDefQuery")
 
-            definitions = graph.getNodeDefinitions()
+            if graph:
+                all_ids = self._definition_ids(graph)[0]
+            else:
+                all_ids = self._defn_id_cache["SDSBSCompGraph"][0]
+            flt = filter_text.lower() if filter_text else ""
             result = []
-            for defn in list(definitions):
-                try:
-                    did = defn.getId()
-                    if filter_text and filter_text.lower() not in did.lower():
-                        continue
-                    result.append(did)
-                    if len(result) >= limit:
-                        break
-                except Exception:
-                    pass
+            for did in all_ids:
+                if flt and flt not in did.lower():
+                    continue
+                result.append(did)
+                if len(result) >= limit:
+                    break
 
             return {
                 "count":       len(result),
@@ -1275,6 +2020,7 @@ class CommandHandler:
             if temp_pkg is not None:
                 try:
                     self._pkg_mgr().unloadUserPackage(temp_pkg)
+                    self._url_resource_cache.clear()
                 except Exception:
                     pass
 
@@ -1282,7 +2028,7 @@ class CommandHandler:
         graph = self._resolve_graph(graph_identifier)
         # Validate before calling newNode — unknown defs HANG SD 15
         try:
-            known = {d.getId() for d in list(graph.getNodeDefinitions())}
+            known = self._definition_ids(graph)[1]
             if definition_id not in known:
                 raise ValueError(
                     "Unknown definition '{}'. "
@@ -1299,22 +2045,14 @@ class CommandHandler:
         if position and len(position) >= 2:
             node.setPosition(float2(float(position[0]), float(position[1])))
         return {
-            "node_id":    node.getIdentifier(),
+            "node_id":    self._index_node(graph, node),
             "definition": self._get_node_def_id(node),
             "position":   list(position) if position else [0.0, 0.0],
         }
 
     def create_instance_node(self, resource_url, graph_identifier=None, position=None):
         graph = self._resolve_graph(graph_identifier)
-        resource = None
-        for pkg in list(self._pkg_mgr().getPackages()):
-            try:
-                r = pkg.findResourceFromUrl(resource_url)
-                if r is not None:
-                    resource = r
-                    break
-            except Exception:
-                pass
+        resource = self._find_resource(resource_url)
         if not resource:
             raise ValueError("Resource '{}' not found.".format(resource_url))
         node = graph.newInstanceNode(resource)
@@ -1323,7 +2061,7 @@ class CommandHandler:
         if position and len(position) >= 2:
             node.setPosition(float2(float(position[0]), float(position[1])))
         return {
-            "node_id":      node.getIdentifier(),
+            "node_id":      self._index_node(graph, node),
             "resource_url": resource_url,
             "position":     list(position) if position else [0.0, 0.0],
             "note":         "Call get_node_info to find exact port IDs before connecting.",
@@ -1344,9 +2082,9 @@ class CommandHandler:
             node.setAnnotationPropertyValueFromId("label", SDValueString.sNew(label))
             label_set = True
         except Exception as e:
-            _log("Warning: label set failed: {}".format(e))
+            _log("Warning: label set failed: {}", e)
         return {
-            "node_id":    node.getIdentifier(),
+            "node_id":    self._index_node(graph, node),
             "definition": "sbs::compositing::output",
             "usage":      usage,
             "label":      label,
@@ -1357,6 +2095,8 @@ class CommandHandler:
         graph = self._resolve_graph(graph_identifier)
         node  = self._find_node(graph, node_id)
         graph.deleteNode(node)
+        self._unindex_node(graph, node_id)
+        self._node_prop_cache.pop(id(node), None)
         return {"deleted": node_id}
 
     def move_node(self, node_id, position, graph_identifier=None):
@@ -1368,11 +2108,11 @@ class CommandHandler:
     def duplicate_node(self, node_id, offset=None, graph_identifier=None):
         graph = self._resolve_graph(graph_identifier)
         node  = self._find_node(graph, node_id)
-        if self._is_instance_node(node):
+        defn_id = self._get_node_def_id(node)
+        if _is_instance_def(defn_id):
             raise ValueError(
                 "Cannot duplicate library node '{}' via duplicate_node. "
                 "Use create_instance_node with the same resource_url.".format(node_id))
-        defn_id = self._get_node_def_id(node)
         pos     = self._get_node_pos(node)
         off     = offset or [100, 0]
         new_node = graph.newNode(defn_id)
@@ -1382,7 +2122,7 @@ class CommandHandler:
         new_node.setPosition(float2(float(new_pos[0]), float(new_pos[1])))
         return {
             "original_node_id": node_id,
-            "new_node_id":      new_node.getIdentifier(),
+            "new_node_id":      self._index_node(graph, new_node),
             "definition":       defn_id,
             "position":         new_pos,
         }
@@ -1391,34 +2131,36 @@ class CommandHandler:
         graph = self._resolve_graph(graph_identifier)
         node  = self._find_node(graph, node_id)
 
+        # Hoisted lookups — these loops run once per property
+        get_props     = node.getProperties
+        get_value     = node.getPropertyValue
+        get_conns     = node.getPropertyConnections
+        serialize     = self._serialize_sd_value
+        system_params = _SYSTEM_PARAMS
+
         inputs = []
         try:
-            for prop in list(node.getProperties(SDPropertyCategory.Input)):
+            for prop in get_props(SDPropertyCategory.Input):
                 pid = prop.getId()
-                if pid in _SYSTEM_PARAMS:
+                if pid in system_params:
                     continue
                 info = {"id": pid}
                 try:
-                    val_obj = node.getPropertyValue(prop)
+                    val_obj = get_value(prop)
                     if val_obj is not None:
-                        info["value"] = self._serialize_sd_value(val_obj)
+                        info["value"] = serialize(val_obj)
                 except Exception:
                     pass
                 try:
-                    conns = node.getPropertyConnections(prop)
-                    if conns is not None:
-                        cl = list(conns)
-                        if cl:
-                            info["connected_from"] = []
-                            for conn in cl:
-                                try:
-                                    sn = conn.getInputPropertyNode()
-                                    sp = conn.getInputProperty()
-                                    if sn and sp:
-                                        info["connected_from"].append(
-                                            "{}.{}".format(sn.getIdentifier(), sp.getId()))
-                                except Exception:
-                                    pass
+                    sources = []
+                    for conn in get_conns(prop) or ():
+                        sn = conn.getInputPropertyNode()
+                        sp = conn.getInputProperty()
+                        if sn is None or sp is None:
+                            continue
+                        sources.append("{}.{}".format(sn.getIdentifier(), sp.getId()))
+                    if sources:
+                        info["connected_from"] = sources
                 except Exception:
                     pass
                 inputs.append(info)
@@ -1427,30 +2169,30 @@ class CommandHandler:
 
         outputs = []
         try:
-            for prop in list(node.getProperties(SDPropertyCategory.Output)):
+            for prop in get_props(SDPropertyCategory.Output):
                 outputs.append({"id": prop.getId()})
         except Exception:
             pass
 
         annotations = []
         try:
-            for prop in list(node.getProperties(SDPropertyCategory.Annotation)):
-                pid = prop.getId()
-                info = {"id": pid}
+            for prop in get_props(SDPropertyCategory.Annotation):
+                info = {"id": prop.getId()}
                 try:
-                    val_obj = node.getPropertyValue(prop)
+                    val_obj = get_value(prop)
                     if val_obj is not None:
-                        info["value"] = self._serialize_sd_value(val_obj)
+                        info["value"] = serialize(val_obj)
                 except Exception:
                     pass
                 annotations.append(info)
         except Exception:
             pass
 
-        is_lib = self._is_instance_node(node)
+        defn_id = self._get_node_def_id(node)
+        is_lib  = _is_instance_def(defn_id)
         return {
             "node_id":        node_id,
-            "definition":     self._get_node_def_id(node),
+            "definition":     defn_id,
             "is_library_node": is_lib,
             "position":       self._get_node_pos(node),
             "inputs":         inputs,
@@ -1469,74 +2211,23 @@ class CommandHandler:
             raw = val.get()
         except Exception:
             return str(val)
-        if hasattr(raw, 'x') and hasattr(raw, 'y'):
-            d = {"x": raw.x, "y": raw.y}
-            if hasattr(raw, 'z'):
-                d["z"] = raw.z
-            if hasattr(raw, 'w'):
-                d["w"] = raw.w
-            return d
-        if hasattr(raw, 'r') and hasattr(raw, 'g'):
-            return {"r": raw.r, "g": raw.g, "b": raw.b, "a": raw.a}
-        if hasattr(raw, 'getSize') and hasattr(raw, 'getItem'):
-            items = []
-            try:
-                for i in range(raw.getSize()):
-                    item = raw.getItem(i)
-                    items.append(str(item.get()) if hasattr(item, 'get') else str(item))
-            except Exception:
-                return str(raw)
-            return items
-        return str(raw)
+        return _serialize_raw(raw)
 
     def get_library_nodes(self, filter_text="", limit=200):
-        pkg_mgr = self._pkg_mgr()
+        # Explicit listing: always re-walk so newly loaded packages show up
+        entries = self._build_lib_index()
+        flt = filter_text.lower() if filter_text else ""
         results = []
-        for pkg in list(pkg_mgr.getPackages()):
-            try:
-                fp = pkg.getFilePath()
-                if not fp:
-                    continue
-                children = None
-                for recursive in (True, False):
-                    try:
-                        c = list(pkg.getChildrenResources(recursive))
-                        if c:
-                            children = c
-                            break
-                    except Exception:
-                        continue
-                if not children:
-                    continue
-                for res in children:
-                    try:
-                        if "SDSBSCompGraph" not in res.getClassName():
-                            continue
-                        rid = res.getIdentifier()
-                        if filter_text and filter_text.lower() not in rid.lower():
-                            continue
-                        url = None
-                        try:
-                            url = res.getUrl()
-                        except Exception:
-                            pass
-                        if not url:
-                            continue
-                        # Update cache
-                        self._lib_url_cache[rid.lower()] = url
-                        results.append({
-                            "identifier": rid,
-                            "url":        url,
-                            "package":    os.path.basename(fp),
-                        })
-                        if len(results) >= limit:
-                            break
-                    except Exception:
-                        pass
-                if len(results) >= limit:
-                    break
-            except Exception:
-                pass
+        for rid, rid_l, url, pkg_name in entries:
+            if flt and flt not in rid_l:
+                continue
+            results.append({
+                "identifier": rid,
+                "url":        url,
+                "package":    pkg_name,
+            })
+            if len(results) >= limit:
+                break
         return {
             "count":     len(results),
             "nodes":     results,
@@ -1591,31 +2282,23 @@ class CommandHandler:
 
         # Determine from_output
         if not from_output:
-            if from_defn in ATOMIC_PORTS:
-                outs = ATOMIC_PORTS[from_defn]["outputs"]
+            known = ATOMIC_PORTS.get(from_defn)
+            if known is not None:
+                outs = known["outputs"]
                 from_output = outs[0] if outs else "unique_filter_output"
             else:
                 # Library node — query
-                try:
-                    outs = [p.getId() for p in
-                            list(from_node.getProperties(SDPropertyCategory.Output))]
-                    from_output = outs[0] if outs else "unique_filter_output"
-                except Exception:
-                    from_output = "unique_filter_output"
+                from_output = (self._default_port(from_node, from_defn, "out")
+                               or "unique_filter_output")
 
         # Determine to_input
         if not to_input:
-            if to_defn in ATOMIC_PORTS:
-                ins = ATOMIC_PORTS[to_defn]["inputs"]
+            known = ATOMIC_PORTS.get(to_defn)
+            if known is not None:
+                ins = known["inputs"]
                 to_input = ins[0] if ins else "input1"
             else:
-                try:
-                    ins = [p.getId() for p in
-                           list(to_node.getProperties(SDPropertyCategory.Input))
-                           if p.getId() not in _SYSTEM_PARAMS]
-                    to_input = ins[0] if ins else "input1"
-                except Exception:
-                    to_input = "input1"
+                to_input = self._default_port(to_node, to_defn, "in") or "input1"
 
         self._safe_connect(graph, from_node, from_output, to_node, to_input)
         return {
@@ -1631,35 +2314,44 @@ class CommandHandler:
     # ═══════════════════════════════════════════════════════════════════════
 
     def set_parameter(self, node_id, parameter_id, value, value_type="float",
-                      graph_identifier=None):
+                      graph_identifier=None, category=None):
+        """category: "input" or "annotation" when the caller knows it — only
+        that category is listed and only its setter is tried."""
+        if category not in (None, "input", "annotation"):
+            raise ValueError("category must be 'input', 'annotation' or omitted.")
         graph = self._resolve_graph(graph_identifier)
         node  = self._find_node(graph, node_id)
         sd_value = self._make_sd_value(value_type, value)
 
-        input_ids  = set()
-        annot_ids  = set()
-        try:
-            for p in list(node.getProperties(SDPropertyCategory.Input)):
-                input_ids.add(p.getId())
-        except Exception:
-            pass
-        try:
-            for p in list(node.getProperties(SDPropertyCategory.Annotation)):
-                annot_ids.add(p.getId())
-        except Exception:
-            pass
+        # Same per-node maps _set_node_params uses (walked once per command)
+        input_ids = self._prop_map(node, "in") if category != "annotation" else {}
+        annot_ids = self._prop_map(node, "annot") if category != "input" else {}
 
         if (input_ids or annot_ids) and \
            parameter_id not in input_ids and parameter_id not in annot_ids:
-            all_ids = sorted(input_ids | annot_ids)
+            all_ids = sorted(input_ids.keys() | annot_ids.keys())
             raise ValueError(
                 "Property '{}' not found on node '{}'. Available: {}".format(
                     parameter_id, node_id, all_ids))
 
+        # The maps say which category owns the id: call only that setter.
+        # Both are tried only when the property lists couldn't be read.
+        in_input = parameter_id in input_ids
+        in_annot = parameter_id in annot_ids
+        if in_input and not in_annot:
+            setters = (node.setInputPropertyValueFromId,)
+        elif in_annot and not in_input:
+            setters = (node.setAnnotationPropertyValueFromId,)
+        elif category == "input":
+            setters = (node.setInputPropertyValueFromId,)
+        elif category == "annotation":
+            setters = (node.setAnnotationPropertyValueFromId,)
+        else:
+            setters = (node.setInputPropertyValueFromId,
+                       node.setAnnotationPropertyValueFromId)
         set_ok = False
         last_err = None
-        for setter in [node.setInputPropertyValueFromId,
-                       node.setAnnotationPropertyValueFromId]:
+        for setter in setters:
             try:
                 setter(parameter_id, sd_value)
                 set_ok = True
@@ -1682,7 +2374,7 @@ class CommandHandler:
         graph = self._resolve_graph(graph_identifier)
         graph.setInputPropertyValueFromId(
             "$outputsize",
-            SDValueInt2.sNew(int2(int(width_log2), int(height_log2)))
+            _sd_int2(int(width_log2), int(height_log2))
         )
         return {
             "graph":       graph.getIdentifier(),
@@ -1695,13 +2387,45 @@ class CommandHandler:
     # ── BATCH GRAPH BUILDER ─────────────────────────────────────────────
     # ═══════════════════════════════════════════════════════════════════════
 
+    def _instantiate_spec(self, graph, spec, defn_id, known_defs):
+        """Create the node described by one batch/recipe spec: an output node,
+        a library instance (resource_url / library_keyword) or an atomic node."""
+        if defn_id == "sbs::compositing::output":
+            lv = spec.get("label") or spec.get("usage") or "output"
+            node = graph.newNode("sbs::compositing::output")
+            if node:
+                try:
+                    node.setAnnotationPropertyValueFromId(
+                        "label", SDValueString.sNew(lv))
+                except Exception:
+                    pass
+        elif spec.get("resource_url"):
+            res_url  = spec["resource_url"]
+            resource = self._find_resource(res_url)
+            node = graph.newInstanceNode(resource) if resource else None
+            if not node:
+                raise ValueError("Resource '{}' not found.".format(res_url))
+        elif spec.get("library_keyword"):
+            node = self._create_library_node(graph, spec["library_keyword"])
+        else:
+            if known_defs and defn_id not in known_defs:
+                raise ValueError("Unknown definition '{}'. "
+                                 "Use library_keyword for library nodes.".format(defn_id))
+            node = graph.newNode(defn_id)
+
+        if not node:
+            raise RuntimeError("newNode returned None for '{}'.".format(defn_id))
+        return node
+
     def create_batch_graph(self, graph_name, package_index=0, package_path=None,
                            nodes=None, connections=None, output_size_log2=11,
-                           open_in_editor=True):
+                           open_in_editor=True, overrides=None):
         """
         Create a complete graph in one call.
         Supports atomic nodes, library nodes (via resource_url or keyword),
         output nodes, and full connection wiring.
+        overrides: {id_alias: {param: value}} merged over the matching specs'
+        parameters as they are read (the specs themselves are never modified).
         """
         if nodes is None:
             nodes = []
@@ -1712,112 +2436,77 @@ class CommandHandler:
         pkg   = self._resolve_package(package_index, package_path)
         graph = SDSBSCompGraph.sNew(pkg)
         graph.setIdentifier(safe_name)
+        self._invalidate_resources()
+        self._graph_by_id.setdefault(graph.getIdentifier(), (pkg.getFilePath(), graph))
 
         try:
             graph.setInputPropertyValueFromId(
                 "$outputsize",
-                SDValueInt2.sNew(int2(int(output_size_log2), int(output_size_log2))))
+                _sd_int2(int(output_size_log2), int(output_size_log2)))
         except Exception as e:
-            _log("Warning: Could not set graph output size: {}".format(e))
+            _log("Warning: Could not set graph output size: {}", e)
 
-        try:
-            _known_defs = {d.getId() for d in list(graph.getNodeDefinitions())}
-        except Exception:
-            _known_defs = set()
+        _known_defs = self._known_defs(graph)
 
-        alias_map = {}       # alias -> (node_obj, node_id_str)
+        node_by_alias = {}   # alias -> node object (connection wiring)
+        node_map      = {}   # alias -> node id string (returned to the client)
+        next_suffix   = {}   # base alias -> last suffix handed out
         created   = []
         failed    = []
+        set_params  = self._set_node_params
+        instantiate = self._instantiate_spec
 
         for spec in nodes:
             defn_id  = spec.get("definition_id", "sbs::compositing::uniform")
             pos      = spec.get("position", [0, 0])
             params   = spec.get("parameters", {})
+            if overrides:
+                ov = overrides.get(spec.get("id_alias"))
+                if ov:
+                    params = {**params, **ov}
             alias    = (spec.get("id_alias") or spec.get("alias")
                         or defn_id.split("::")[-1])
-            orig_alias = alias
-            usage    = spec.get("usage")
-            label    = spec.get("label")
-            res_url  = spec.get("resource_url")
-            lib_kw   = spec.get("library_keyword")
 
             try:
-                node = None
-
-                if defn_id == "sbs::compositing::output":
-                    lv = label or usage or "output"
-                    node = graph.newNode("sbs::compositing::output")
-                    if node:
-                        try:
-                            node.setAnnotationPropertyValueFromId(
-                                "label", SDValueString.sNew(lv))
-                        except Exception:
-                            pass
-
-                elif res_url:
-                    resource = None
-                    for p in list(self._pkg_mgr().getPackages()):
-                        try:
-                            r = p.findResourceFromUrl(res_url)
-                            if r is not None:
-                                resource = r
-                                break
-                        except Exception:
-                            pass
-                    node = graph.newInstanceNode(resource) if resource else None
-                    if not node:
-                        raise ValueError("Resource '{}' not found.".format(res_url))
-
-                elif lib_kw:
-                    node = self._create_library_node(graph, lib_kw)
-
-                else:
-                    if _known_defs and defn_id not in _known_defs:
-                        raise ValueError("Unknown definition '{}'. "
-                                         "Use library_keyword for library nodes.".format(defn_id))
-                    node = graph.newNode(defn_id)
-
-                if not node:
-                    raise RuntimeError("newNode returned None for '{}'.".format(defn_id))
-
+                node = instantiate(graph, spec, defn_id, _known_defs)
                 node.setPosition(float2(float(pos[0]), float(pos[1])))
-                self._set_node_params(node, params)
+                set_params(node, params)
 
                 node_id = node.getIdentifier()
-                # deduplicate aliases
-                counter = 0
-                while alias in alias_map:
-                    counter += 1
-                    alias = "{}_{}".format(orig_alias, counter)
-
-                alias_map[alias] = (node, node_id)
+                alias   = _unique_alias(alias, node_map, next_suffix)
+                node_by_alias[alias] = node
+                node_map[alias]      = node_id
                 actual_def = self._get_node_def_id(node)
                 created.append({
                     "alias": alias, "node_id": node_id, "definition": actual_def})
 
             except Exception as e:
-                _log("Error creating node '{}': {}".format(alias, e))
+                _log("Error creating node '{}': {}", alias, e)
                 failed.append({"alias": alias, "error": str(e)})
 
-        conn_results = []
+        conn_results  = []
+        conn_ok       = 0
+        node_for      = node_by_alias.get
+        connect       = self._safe_connect
         for conn in connections:
             fa  = conn.get("from") or conn.get("from_alias")
             ta  = conn.get("to") or conn.get("to_alias")
             fo  = conn.get("from_output", "unique_filter_output")
             ti  = conn.get("to_input", "input1")
 
-            if fa not in alias_map:
+            fn = node_for(fa)
+            if fn is None:
                 conn_results.append({"error": "from '{}' not found".format(fa), "conn": conn})
                 continue
-            if ta not in alias_map:
+            tn = node_for(ta)
+            if tn is None:
                 conn_results.append({"error": "to '{}' not found".format(ta), "conn": conn})
                 continue
 
-            fn, _ = alias_map[fa]
-            tn, _ = alias_map[ta]
             try:
-                self._safe_connect(graph, fn, fo, tn, ti)
+                connect(graph, fn, fo, tn, ti)
                 conn_results.append({"from": fa, "to": ta, "success": True})
+                conn_ok += 1
             except Exception as e:
                 conn_results.append({"from": fa, "to": ta, "success": False, "error": str(e)})
 
@@ -1825,20 +2514,24 @@ class CommandHandler:
             try:
                 self._ui_mgr().openResourceInEditor(graph)
             except Exception as e:
-                _log("Warning: openResourceInEditor failed: {}".format(e))
+                _log("Warning: openResourceInEditor failed: {}", e)
 
-        return {
+        result = {
             "graph_identifier":  graph.getIdentifier(),
             "requested_name":    graph_name,
             "nodes_created":     len(created),
             "nodes_failed":      len(failed),
-            "connections_ok":    sum(1 for c in conn_results if c.get("success")),
-            "connections_failed": sum(1 for c in conn_results if not c.get("success")),
-            "node_map":          {a: nid for a, (_, nid) in alias_map.items()},
+            "connections_ok":    conn_ok,
+            "connections_failed": len(conn_results) - conn_ok,
+            "node_map":          node_map,
             "nodes":             created,
             "failed_nodes":      failed,
             "connections":       conn_results,
         }
+        unmatched = _unmatched_overrides(nodes, overrides)
+        if unmatched:
+            result["unmatched_overrides"] = unmatched
+        return result
 
     # ═══════════════════════════════════════════════════════════════════════
     # ── SMART MATERIAL GRAPH BUILDER ────────────────────────────────────
@@ -1852,26 +2545,19 @@ class CommandHandler:
         Build a complete PBR material graph from a named recipe.
         overrides: dict of parameter overrides applied on top of recipe defaults.
         """
-        from .recipes import RECIPE_REGISTRY
-        recipe_name_key = recipe_name.lower().replace(" ", "_").replace("-", "_")
+        if RECIPE_REGISTRY is None:
+            raise RuntimeError(_RECIPES_ERROR)
+        recipe_name_key = _normalize_recipe_name(recipe_name)
         recipe = RECIPE_REGISTRY.get(recipe_name_key)
         if not recipe:
             available = sorted(RECIPE_REGISTRY.keys())
             raise ValueError(
                 "Recipe '{}' not found. Available: {}".format(recipe_name, available))
 
-        # Apply overrides
-        if overrides:
-            import copy
-            recipe = copy.deepcopy(recipe)
-            for node_alias, node_overrides in overrides.items():
-                for spec in recipe.get("nodes", []):
-                    if spec.get("id_alias") == node_alias:
-                        spec.setdefault("parameters", {}).update(node_overrides)
-
         nodes       = recipe.get("nodes", [])
         connections = recipe.get("connections", [])
 
+        # Overrides are layered over the shared recipe specs at read time
         return self.create_batch_graph(
             graph_name       = graph_name,
             package_index    = package_index,
@@ -1880,6 +2566,7 @@ class CommandHandler:
             connections      = connections,
             output_size_log2 = output_size_log2,
             open_in_editor   = open_in_editor,
+            overrides        = overrides,
         )
 
     def build_heightmap_graph(self, graph_name, style,
@@ -1891,11 +2578,12 @@ class CommandHandler:
         style: 'cliff', 'rock', 'cracked', 'sand', 'mud', 'mountain', 'cobblestone'
         detail_level: 1=basic, 2=standard, 3=high detail
         """
-        from .recipes import HEIGHTMAP_RECIPES
+        if HEIGHTMAP_RECIPES is None:
+            raise RuntimeError(_RECIPES_ERROR)
         style_key = style.lower().replace(" ", "_")
         builder   = HEIGHTMAP_RECIPES.get(style_key)
         if not builder:
-            available = sorted(HEIGHTMAP_RECIPES.keys())
+            available = list(_HEIGHTMAP_STYLES)
             raise ValueError(
                 "Heightmap style '{}' not found. Available: {}".format(style, available))
 
@@ -1918,53 +2606,40 @@ class CommandHandler:
 
     def list_recipes(self):
         """List all available material recipes."""
-        try:
-            from .recipes import RECIPE_REGISTRY, HEIGHTMAP_RECIPES
-            recipes = []
-            for key, recipe in RECIPE_REGISTRY.items():
-                recipes.append({
-                    "key":         key,
-                    "name":        recipe.get("name", key),
-                    "category":    recipe.get("category", "unknown"),
-                    "description": recipe.get("description", ""),
-                    "node_count":  len(recipe.get("nodes", [])),
-                    "outputs":     recipe.get("outputs", []),
-                })
-            heightmaps = sorted(HEIGHTMAP_RECIPES.keys())
-            return {
-                "material_recipes": recipes,
-                "heightmap_styles": heightmaps,
-                "total_recipes": len(recipes),
-                "total_heightmap_styles": len(heightmaps),
-            }
-        except ImportError as e:
-            return {"error": "Recipes module not loaded: {}".format(e)}
+        if RECIPE_REGISTRY is None:
+            return {"error": _RECIPES_ERROR}
+        recipes = list(_recipe_summaries())
+        heightmaps = _HEIGHTMAP_STYLES
+        return {
+            "material_recipes": recipes,
+            "heightmap_styles": heightmaps,
+            "total_recipes": len(recipes),
+            "total_heightmap_styles": len(heightmaps),
+        }
 
     def get_recipe_info(self, recipe_name):
         """Get detailed info about a specific recipe."""
-        try:
-            from .recipes import RECIPE_REGISTRY
-            key = recipe_name.lower().replace(" ", "_").replace("-", "_")
-            recipe = RECIPE_REGISTRY.get(key)
-            if not recipe:
-                return {"error": "Recipe '{}' not found.".format(recipe_name)}
-            return {
-                "key":          key,
-                "name":         recipe.get("name", key),
-                "category":     recipe.get("category", "unknown"),
-                "description":  recipe.get("description", ""),
-                "outputs":      recipe.get("outputs", []),
-                "node_count":   len(recipe.get("nodes", [])),
-                "nodes_preview": [
-                    {
-                        "alias": s.get("id_alias", "?"),
-                        "type":  s.get("definition_id", s.get("library_keyword", "?")),
-                    }
-                    for s in recipe.get("nodes", [])[:20]
-                ],
-            }
-        except ImportError as e:
-            return {"error": "Recipes module not loaded: {}".format(e)}
+        if RECIPE_REGISTRY is None:
+            return {"error": _RECIPES_ERROR}
+        key = _normalize_recipe_name(recipe_name)
+        recipe = RECIPE_REGISTRY.get(key)
+        if not recipe:
+            return {"error": "Recipe '{}' not found.".format(recipe_name)}
+        return {
+            "key":          key,
+            "name":         recipe.get("name", key),
+            "category":     recipe.get("category", "unknown"),
+            "description":  recipe.get("description", ""),
+            "outputs":      recipe.get("outputs", []),
+            "node_count":   len(recipe.get("nodes", [])),
+            "nodes_preview": [
+                {
+                    "alias": s.get("id_alias", "?"),
+                    "type":  s.get("definition_id", s.get("library_keyword", "?")),
+                }
+                for s in recipe.get("nodes", [])[:20]
+            ],
+        }
 
     def apply_recipe(self, recipe_name, graph_identifier=None, position_offset=None,
                      overrides=None):
@@ -1972,132 +2647,93 @@ class CommandHandler:
         Apply a recipe to an EXISTING graph (add nodes + connections to current graph).
         Useful for combining multiple recipes or adding detail passes to existing work.
         """
-        try:
-            from .recipes import RECIPE_REGISTRY
-        except ImportError as e:
-            raise RuntimeError("Recipes module not loaded: {}".format(e))
+        if RECIPE_REGISTRY is None:
+            raise RuntimeError(_RECIPES_ERROR)
 
-        key    = recipe_name.lower().replace(" ", "_").replace("-", "_")
+        key    = _normalize_recipe_name(recipe_name)
         recipe = RECIPE_REGISTRY.get(key)
         if not recipe:
             raise ValueError("Recipe '{}' not found.".format(recipe_name))
 
-        import copy
-        recipe = copy.deepcopy(recipe)
-
-        # Apply position offset
-        if position_offset:
-            ox, oy = float(position_offset[0]), float(position_offset[1])
-            for spec in recipe.get("nodes", []):
-                p = spec.get("position", [0, 0])
-                spec["position"] = [p[0] + ox, p[1] + oy]
-
-        # Apply overrides
-        if overrides:
-            for node_alias, node_overrides in overrides.items():
-                for spec in recipe.get("nodes", []):
-                    if spec.get("id_alias") == node_alias:
-                        spec.setdefault("parameters", {}).update(node_overrides)
+        # The registry specs are shared: offset and overrides are applied as
+        # each spec is read instead of on a copy of the recipe. A zero float
+        # offset also makes the float() coercion of each coordinate implicit.
+        ox, oy = ((float(position_offset[0]), float(position_offset[1]))
+                  if position_offset else (0.0, 0.0))
 
         graph     = self._resolve_graph(graph_identifier)
         nodes     = recipe.get("nodes", [])
         conns     = recipe.get("connections", [])
 
-        try:
-            _known_defs = {d.getId() for d in list(graph.getNodeDefinitions())}
-        except Exception:
-            _known_defs = set()
+        _known_defs = self._known_defs(graph)
 
-        alias_map = {}
+        node_by_alias = {}
+        node_map      = {}
+        next_suffix   = {}
         created   = []
         failed    = []
+        set_params  = self._set_node_params
+        instantiate = self._instantiate_spec
 
         for spec in nodes:
             defn_id    = spec.get("definition_id", "sbs::compositing::uniform")
-            pos        = spec.get("position", [0, 0])
+            pos        = spec.get("position", (0, 0))
             params     = spec.get("parameters", {})
+            if overrides:
+                ov = overrides.get(spec.get("id_alias"))
+                if ov:
+                    params = {**params, **ov}
             alias      = spec.get("id_alias") or defn_id.split("::")[-1]
-            orig_alias = alias
-            res_url    = spec.get("resource_url")
-            lib_kw     = spec.get("library_keyword")
-            label      = spec.get("label")
-            usage      = spec.get("usage")
 
             try:
-                node = None
-                if defn_id == "sbs::compositing::output":
-                    lv = label or usage or "output"
-                    node = graph.newNode("sbs::compositing::output")
-                    if node:
-                        try:
-                            node.setAnnotationPropertyValueFromId(
-                                "label", SDValueString.sNew(lv))
-                        except Exception:
-                            pass
-                elif res_url:
-                    resource = None
-                    for p in list(self._pkg_mgr().getPackages()):
-                        try:
-                            r = p.findResourceFromUrl(res_url)
-                            if r is not None:
-                                resource = r
-                                break
-                        except Exception:
-                            pass
-                    node = graph.newInstanceNode(resource) if resource else None
-                    if not node:
-                        raise ValueError("Resource '{}' not found.".format(res_url))
-                elif lib_kw:
-                    node = self._create_library_node(graph, lib_kw)
-                else:
-                    if _known_defs and defn_id not in _known_defs:
-                        raise ValueError("Unknown definition '{}'.".format(defn_id))
-                    node = graph.newNode(defn_id)
-
-                if not node:
-                    raise RuntimeError("newNode returned None.")
-
-                node.setPosition(float2(float(pos[0]), float(pos[1])))
-                self._set_node_params(node, params)
-
-                nid = node.getIdentifier()
-                counter = 0
-                while alias in alias_map:
-                    counter += 1
-                    alias = "{}_{}".format(orig_alias, counter)
-                alias_map[alias] = (node, nid)
+                node = instantiate(graph, spec, defn_id, _known_defs)
+                node.setPosition(float2(pos[0] + ox, pos[1] + oy))
+                set_params(node, params)
+
+                nid   = node.getIdentifier()
+                alias = _unique_alias(alias, node_map, next_suffix)
+                node_by_alias[alias] = node
+                node_map[alias]      = nid
                 created.append({"alias": alias, "node_id": nid})
 
             except Exception as e:
-                _log("Error creating node '{}': {}".format(alias, e))
+                _log("Error creating node '{}': {}", alias, e)
                 failed.append({"alias": alias, "error": str(e)})
 
-        conn_results = []
+        conn_results  = []
+        conn_ok       = 0
+        node_for      = node_by_alias.get
+        connect       = self._safe_connect
         for conn in conns:
             fa = conn.get("from") or conn.get("from_alias")
             ta = conn.get("to") or conn.get("to_alias")
             fo = conn.get("from_output", "unique_filter_output")
             ti = conn.get("to_input", "input1")
-            if fa not in alias_map or ta not in alias_map:
+            fn = node_for(fa)
+            tn = node_for(ta)
+            if fn is None or tn is None:
                 conn_results.append({"error": "alias not found", "conn": conn})
                 continue
-            fn, _ = alias_map[fa]
-            tn, _ = alias_map[ta]
             try:
-                self._safe_connect(graph, fn, fo, tn, ti)
+                connect(graph, fn, fo, tn, ti)
                 conn_results.append({"from": fa, "to": ta, "success": True})
+                conn_ok += 1
             except Exception as e:
                 conn_results.append({"from": fa, "to": ta, "success": False, "error": str(e)})
 
-        return {
+        result = {
             "graph_identifier":  graph.getIdentifier(),
             "recipe":            recipe_name,
             "nodes_added":       len(created),
             "nodes_failed":      len(failed),
-            "connections_ok":    sum(1 for c in conn_results if c.get("success")),
-            "connections_failed": sum(1 for c in conn_results if not c.get("success")),
-            "node_map":          {a: nid for a, (_, nid) in alias_map.items()},
+            "connections_ok":    conn_ok,
+            "connections_failed": len(conn_results) - conn_ok,
+            "node_map":          node_map,
         }
+        unmatched = _unmatched_overrides(nodes, overrides)
+        if unmatched:
+            result["unmatched_overrides"] = unmatched
+        return result
 
     # ═══════════════════════════════════════════════════════════════════════
     # ── UTILITIES ───────────────────────────────────────────────────────
@@ -2110,12 +2746,13 @@ class CommandHandler:
         Only use when connections don't matter.
         """
         graph = self._resolve_graph(graph_identifier)
-        nodes = list(graph.getNodes())
-        if not nodes:
+        nodes = graph.getNodes()
+        total = _sd_len(nodes)
+        if not total:
             return {"graph": graph.getIdentifier(), "arranged_nodes": 0,
                     "warning": "No nodes to arrange."}
 
-        per_row = max(1, int(len(nodes) ** 0.5) + 1)
+        per_row = max(1, int(total ** 0.5) + 1)
         x, y = float(start_x), float(start_y)
         for i, node in enumerate(nodes):
             try:
@@ -2129,7 +2766,7 @@ class CommandHandler:
 
         return {
             "graph":          graph.getIdentifier(),
-            "arranged_nodes": len(nodes),
+            "arranged_nodes": total,
             "warning":        "arrange_nodes DESTROYS all connections in SD 15.",
         }
 
@@ -2176,20 +2813,23 @@ class CommandHandler:
         """Execute arbitrary Python on the SD main thread. Keep it short."""
         stdout_cap = io.StringIO()
         stderr_cap = io.StringIO()
-        app_obj    = sd.getContext().getSDApplication()
+        # Session-cached managers: no getPackageMgr/getUIMgr round trips per call
+        ui_mgr     = self._ui_mgr()
 
         def _open_in_editor_safe(g):
             try:
-                app_obj.getUIMgr().openResourceInEditor(g)
+                ui_mgr.openResourceInEditor(g)
             except Exception as e:
                 print("[MCP] open_in_editor warning: {}".format(e))
 
-        namespace = {
-            "sd": sd, "app": app_obj,
-            "pkg_mgr": app_obj.getPackageMgr(),
-            "ui_mgr":  app_obj.getUIMgr(),
-            "open_in_editor": _open_in_editor_safe,
-        }
+        # Fresh copy per call: exec() writes the user's globals into it
+        namespace = _EXEC_NS_TEMPLATE.copy()
+        namespace.update(
+            app=self._app(),
+            pkg_mgr=self._pkg_mgr(),
+            ui_mgr=ui_mgr,
+            open_in_editor=_open_in_editor_safe,
+        )
         error = None
         try:
             with redirect_stdout(stdout_cap), redirect_stderr(stderr_cap):
@@ -2212,15 +2852,15 @@ class CommandHandler:
 
 def initializeSDPlugin():
     global _server
-    _log("Initializing v{}".format(".".join(map(str, PLUGIN_VERSION))))
+    _log("Initializing v{}", ".".join(map(str, PLUGIN_VERSION)))
 
     if _pyside_path:
-        _log("PySide path injected: {}".format(_pyside_path))
+        _log("PySide path injected: {}", _pyside_path)
     else:
         _log("Warning: PySide6 path not found")
 
     if _QT_BINDING_USED:
-        _log("Qt binding: {}".format(_QT_BINDING_USED))
+        _log("Qt binding: {}", _QT_BINDING_USED)
     else:
         _log("FATAL: No Qt binding. All MCP calls will fail.")
 
@@ -2233,10 +2873,10 @@ def initializeSDPlugin():
     try:
         _server = SDMCPServer(ports=DEFAULT_PORTS)
         _server.start()
-        _log("Plugin v{} ready! Port: {}".format(
-            ".".join(map(str, PLUGIN_VERSION)), DEFAULT_PORTS))
+        _log("Plugin v{} ready! Port: {}",
+             ".".join(map(str, PLUGIN_VERSION)), DEFAULT_PORTS)
     except Exception as e:
-        _log("FATAL: Failed to start server: {}".format(e))
+        _log("FATAL: Failed to start server: {}", e)
         traceback.print_exc()
 
 
@@ -7,7 +7,8 @@ Relay between Claude (stdio/FastMCP) and the SD plugin (TCP).
 Architecture: Claude -> stdio -> this bridge -> TCP localhost:<port> -> SD plugin
 
 Protocol: Length-prefix framing [4-byte big-endian length][JSON payload]
-Connection: Fresh TCP socket per command (no persistent connection)
+Connection: Persistent TCP socket (TCP_NODELAY), reconnected on demand when the
+            plugin closes it (idle timeout, SD restart)
 
 Fixes in v2.0.0:
   BUG-B01: _send_lock no longer held across full retry loop (prevents 360s deadlock)
@@ -31,6 +32,7 @@ import logging
 import argparse
 import asyncio
 import time
+import select
 import threading
 from typing import Any, List, Optional
 from contextlib import asynccontextmanager
@@ -43,6 +45,11 @@ if os.path.exists(venv_site):
 
 from mcp.server.fastmcp import FastMCP, Context
 
+try:
+    import orjson   # optional: faster decode of large responses (graph_snapshot, etc.)
+except ImportError:
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
@@ -55,6 +62,7 @@ logger = logging.getLogger("SD_MCP_Bridge")
 TIMEOUT = 120          # SD can be slow on heavy operations
 CONNECT_TIMEOUT = 5    # timeout for initial TCP connection
 HEADER_SIZE = 4
+_FRAME_HEADER = struct.Struct(">I")   # compiled once; big-endian payload length
 MAX_RETRIES = 2        # only for connection failures, not SD operation timeouts
 RETRY_DELAY = 1.0      # seconds between retry attempts
 
@@ -66,24 +74,30 @@ _sd_port: int = 9881   # BUG-B03 fix: default matches SD plugin DEFAULT_PORTS
 # socket operation. This prevents a single timeout from blocking the bridge for
 # 3 x 120 = 360 seconds. Each _send_command call acquires its own lock window.
 _send_lock = threading.Lock()
+_sock: Optional[socket.socket] = None   # persistent connection, guarded by _send_lock
 
 
 # ---------------------------------------------------------------------------
 # Length-prefix protocol
 # ---------------------------------------------------------------------------
 def _send_framed(sock: socket.socket, data: bytes) -> None:
-    sock.sendall(struct.pack(">I", len(data)) + data)
+    # Header + payload in one sendall (sendmsg would skip the copy, but it
+    # isn't available on Windows)
+    sock.sendall(_FRAME_HEADER.pack(len(data)) + data)
 
 
 def _recv_exact(sock: socket.socket, n: int) -> bytes:
     """Read exactly n bytes. Returns b"" on clean disconnect."""
-    buf = b""
-    while len(buf) < n:
-        chunk = sock.recv(n - len(buf))
-        if not chunk:
+    # One preallocated buffer filled in place — no per-chunk concat copies
+    buf = bytearray(n)
+    view = memoryview(buf)
+    got = 0
+    while got < n:
+        r = sock.recv_into(view[got:], n - got)
+        if not r:
             return b""
-        buf += chunk
-    return buf
+        got += r
+    return bytes(buf)
 
 
 def _recv_framed(sock: socket.socket, timeout: float) -> bytes:
@@ -91,7 +105,7 @@ def _recv_framed(sock: socket.socket, timeout: float) -> bytes:
     header = _recv_exact(sock, HEADER_SIZE)
     if not header:
         raise ConnectionAbortedError("Connection closed while reading header.")
-    msg_len = struct.unpack(">I", header)[0]
+    msg_len = _FRAME_HEADER.unpack(header)[0]
     if msg_len == 0:
         return b""
     if msg_len > 100 * 1024 * 1024:
@@ -103,17 +117,9 @@ def _recv_framed(sock: socket.socket, timeout: float) -> bytes:
 
 
 # ---------------------------------------------------------------------------
-# Send command — BUG-B01 fix: lock held only for the socket operation
+# Persistent connection (guarded by _send_lock)
 # ---------------------------------------------------------------------------
-def _send_command_locked(cmd_type: str, params: dict = None) -> dict:
-    """
-    Open fresh TCP connection, send one command, receive one response.
-    Lock is acquired INSIDE this function for the duration of the socket op.
-    This prevents a single timeout from holding the lock for 120+ seconds.
-    """
-    command = {"type": cmd_type, "params": params or {}}
-    data_out = json.dumps(command).encode("utf-8")
-
+def _connect() -> socket.socket:
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     sock.settimeout(CONNECT_TIMEOUT)
     try:
@@ -123,28 +129,105 @@ def _send_command_locked(cmd_type: str, params: dict = None) -> dict:
         raise ConnectionError(
             f"Cannot connect to Substance Designer on localhost:{_sd_port}. "
             f"Is SD running with the MCP plugin loaded? ({e})")
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    return sock
 
-    # Acquire lock AFTER connection is established — only for the send/recv cycle
-    with _send_lock:
+
+def _is_stale(sock: socket.socket) -> bool:
+    """An idle connection is never readable — readable means EOF or an error."""
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+        return bool(readable)
+    except (OSError, ValueError):
+        return True
+
+
+def _close_sock() -> None:
+    global _sock
+    if _sock is not None:
         try:
-            _send_framed(sock, data_out)
-            response_bytes = _recv_framed(sock, TIMEOUT)
-            if not response_bytes:
-                return {"status": "error", "message": f"Empty response from SD on '{cmd_type}'."}
-            return json.loads(response_bytes.decode("utf-8"))
-        except socket.timeout:
-            return {"status": "error",
-                    "message": f"Timeout ({TIMEOUT}s) waiting for SD on '{cmd_type}'. "
-                               f"SD may be busy — try again."}
-        except json.JSONDecodeError as e:
-            return {"status": "error", "message": f"Invalid JSON from SD: {e}"}
-        except Exception as e:
-            return {"status": "error", "message": f"Communication error: {e}"}
-        finally:
+            _sock.close()
+        except Exception:
+            pass
+        _sock = None
+
+
+def _encode_command(command: dict) -> bytes:
+    """UTF-8 JSON payload for one command frame."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(command)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits — stdlib copes
+    return json.dumps(command).encode("utf-8")
+
+
+def _decode_response(response_bytes: bytes) -> dict:
+    """Parse one response frame. The plugin's stdlib encoder emits bare
+    NaN/Infinity tokens, which orjson rejects but json accepts."""
+    if orjson is not None:
+        try:
+            return orjson.loads(response_bytes)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(response_bytes.decode("utf-8"))
+
+
+# ---------------------------------------------------------------------------
+# Send command — BUG-B01 fix: lock held only for the socket operation
+# ---------------------------------------------------------------------------
+def _send_command_locked(cmd_type: str, params: dict = None) -> dict:
+    """
+    Send one command over the persistent connection, receive one response.
+    Lock is acquired INSIDE this function for the duration of the socket op.
+    This prevents a single timeout from holding the lock for 120+ seconds.
+    A reused socket the plugin has closed in the meantime is replaced once.
+    """
+    global _sock
+    command = {"type": cmd_type, "params": params or {}}
+    data_out = _encode_command(command)
+
+    with _send_lock:
+        if _sock is not None and _is_stale(_sock):
+            _close_sock()
+        for attempt in range(2):
+            reused = _sock is not None
+            if not reused:
+                _sock = _connect()
             try:
-                sock.close()
-            except Exception:
-                pass
+                _send_framed(_sock, data_out)
+                response_bytes = _recv_framed(_sock, TIMEOUT)
+                if not response_bytes:
+                    return {"status": "error", "message": f"Empty response from SD on '{cmd_type}'."}
+                return _decode_response(response_bytes)
+            except (ConnectionAbortedError, ConnectionResetError, BrokenPipeError) as e:
+                # Peer closed a reused socket before answering: reconnect once
+                _close_sock()
+                if reused and attempt == 0:
+                    continue
+                return {"status": "error", "message": f"Communication error: {e}"}
+            except socket.timeout:
+                # The late response would desync the stream — drop the connection
+                _close_sock()
+                return {"status": "error",
+                        "message": f"Timeout ({TIMEOUT}s) waiting for SD on '{cmd_type}'. "
+                                   f"SD may be busy — try again."}
+            except json.JSONDecodeError as e:
+                return {"status": "error", "message": f"Invalid JSON from SD: {e}"}
+            except Exception as e:
+                _close_sock()
+                return {"status": "error", "message": f"Communication error: {e}"}
+
+
+def _format_result(result) -> str:
+    """Indented JSON text handed back to the MCP client (recipes, snapshots...)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits — stdlib copes
+    return json.dumps(result, indent=2)
 
 
 def _send(cmd_type: str, params: dict = None) -> str:
@@ -173,7 +256,7 @@ def _send(cmd_type: str, params: dict = None) -> str:
             # BUG-B07 fix: None result returns "{}" not "null"
             if result is None:
                 result = {}
-            return json.dumps(result, indent=2)
+            return _format_result(result)
         except ConnectionError as e:
             last_error = str(e)
             if attempt < MAX_RETRIES:
@@ -467,7 +550,8 @@ async def set_parameter(ctx: Context,
                         parameter_id: str,
                         value: Any,
                         value_type: str = "float",
-                        graph_identifier: Optional[str] = None) -> str:
+                        graph_identifier: Optional[str] = None,
+                        category: Optional[str] = None) -> str:
     """
     Set a parameter on a node in Substance Designer.
     - node_id: target node identifier
@@ -494,14 +578,18 @@ async def set_parameter(ctx: Context,
     - value_type: 'float', 'int', 'bool', 'string', 'float2', 'float3', 'float4',
                   'color' (RGBA 0-1), 'int2', 'int3', 'int4'
     - graph_identifier: target graph (None = current)
+    - category: 'input' or 'annotation' if known (skips probing the other one)
     """
-    return await _async_send("set_parameter", {
+    params = {
         "node_id": node_id,
         "parameter_id": parameter_id,
         "value": value,
         "value_type": value_type,
         "graph_identifier": graph_identifier,
-    })
+    }
+    if category:
+        params["category"] = category
+    return await _async_send("set_parameter", params)
 
 
 @mcp.tool()